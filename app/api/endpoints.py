@@ -1,19 +1,26 @@
 """API endpoints for the Resume Verification System."""
 
-from typing import Optional
-from urllib import response
-from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
+import asyncio
+import json
+from contextlib import ExitStack
+from typing import Any, Awaitable, List, Optional
+from fastapi import APIRouter, UploadFile, File, HTTPException, Form, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 
 from app.models.request import VerificationRequest
 from app.models.response import VerificationResponse, ErrorResponse, SkillMatch
 from app.services.resume_parser import ResumeParser
 from app.services.skill_extractor import SkillExtractor
 from app.services.github_verifier import GitHubVerifier
+from app.services.github_token_pool import GitHubRateLimitError
+from app.services.job_queue import JobQueue, JobQueueFullError
 from app.services.scoring_engine import ScoringEngine
-from app.utils.file_handler import FileHandler
+from app.services.verification_pipeline import NotAPdfError, VerificationPipeline, error_status
+from app.utils.file_handler import FileHandler, FileTooLargeError
+from app.utils.metrics import STAGE_DURATION
+from app.utils.profiler import PROFILE_ID_HEADER, RequestProfiler
 from app.config import settings
-from datetime import datetime
 
 
 router = APIRouter()
@@ -22,152 +29,352 @@ skill_extractor = SkillExtractor()
 github_verifier = GitHubVerifier()
 scoring_engine = ScoringEngine()
 file_handler = FileHandler()
+pipeline = VerificationPipeline(
+    resume_parser,
+    skill_extractor,
+    github_verifier,
+    scoring_engine,
+    parse_concurrency=settings.BATCH_PARSE_CONCURRENCY,
+    github_concurrency=settings.BATCH_GITHUB_CONCURRENCY,
+)
+job_queue = JobQueue(
+    settings.JOB_DB_PATH,
+    pipeline.verify,
+    workers=settings.JOB_WORKERS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS,
+    retry_delay=settings.JOB_RETRY_DELAY,
+    result_ttl=settings.JOB_RESULT_TTL,
+    max_queued=settings.JOB_MAX_QUEUED,
+    lease_time=settings.JOB_LEASE_TIME,
+)
+profiler = RequestProfiler(
+    settings.PROFILE_DIR,
+    sample_rate=settings.PROFILE_SAMPLE_RATE,
+    admin_token=settings.PROFILE_ADMIN_TOKEN,
+    interval=settings.PROFILE_INTERVAL,
+    max_files=settings.PROFILE_MAX_FILES,
+    max_bytes=settings.PROFILE_MAX_BYTES,
+)
+
+DISCONNECT_POLL_INTERVAL = 0.5  # seconds
+
+
+def _rate_limited(error: GitHubRateLimitError) -> HTTPException:
+    """Build a 503 response for exhausted GitHub quota."""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(int(error.retry_after) + 1)}
+    )
+
+
+def _verification_error(error: Exception) -> HTTPException:
+    """Build the error response for a failed verification."""
+    if isinstance(error, GitHubRateLimitError):
+        return _rate_limited(error)
+    status_code, detail = error_status(error)
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+def _with_profile_id(error: HTTPException, profile_id: Optional[str]) -> HTTPException:
+    """Name the request's stack profile on an error response."""
+    if profile_id:
+        error.headers = {**(error.headers or {}), PROFILE_ID_HEADER: profile_id}
+    return error
+
+
+async def _read_upload(upload: UploadFile) -> bytes:
+    """Read an uploaded resume into memory."""
+    with STAGE_DURATION.time('upload'):
+        return await file_handler.read_upload_file(upload)
+
+
+async def _run_until_disconnect(request: Request, awaitable: Awaitable) -> Any:
+    """Await a result, cancelling the work if the client disconnects first."""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        task.cancel()
 
 
 @router.post("/verify", response_model=VerificationResponse)
 async def verify_resume(
+    request: Request,
+    response: Response,
     resume: UploadFile = File(...),
-    github_username: str = Form(...)
+    github_username: str = Form(...),
+    async_mode: bool = Query(False, alias="async")
 ):
     """
     Complete resume verification endpoint.
     
     - Upload PDF resume
     - Extract skills from resume
-    - Verify against GitHub profile
+    - Verify against GitHub profile, fetched while the resume is parsed
     - Return trust score and risk assessment
+    
+    Uploads without a PDF header are rejected with 400 before GitHub is
+    contacted or a job is queued. If the resume fails later, the GitHub
+    fetch stops before its next stage; requests already sent still
+    complete and are cached.
+    
+    With ?async=true the verification is queued and a job id is returned
+    immediately with status 202; poll /jobs/{job_id} for the result.
+    
+    Profiled requests (see PROFILE_* settings) name their stack profile,
+    a process-wide sample taken while the request ran, in the
+    X-Profile-Id response header.
     """
-    try:
-        # Validate file
-        if not file_handler.validate_file_extension(resume.filename):
-            raise HTTPException(
-                status_code=400,
-                detail="Only PDF files are allowed"
-            )
+    with profiler.capture(request, "verify") as profile_id:
+        if profile_id:
+            response.headers[PROFILE_ID_HEADER] = profile_id
         
-        if not file_handler.validate_file_size(resume.size):
+        try:
+            # Validate file
+            if not file_handler.validate_file_extension(resume.filename):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Only PDF files are allowed"
+                )
+            
+            if async_mode:
+                pdf_bytes = await _read_upload(resume)
+                if not file_handler.validate_pdf_header(pdf_bytes):
+                    raise NotAPdfError("Uploaded file is not a PDF")
+                job_id = await job_queue.submit(pdf_bytes, github_username)
+                status_url = str(request.url_for("get_job", job_id=job_id))
+                headers = {"Location": status_url}
+                if profile_id:
+                    headers[PROFILE_ID_HEADER] = profile_id
+                return JSONResponse(
+                    status_code=202,
+                    content={
+                        "job_id": job_id,
+                        "status": JobQueue.QUEUED,
+                        "status_url": status_url
+                    },
+                    headers=headers
+                )
+            
+            # Fetch the GitHub profile while the resume is read and parsed
+            return await _run_until_disconnect(
+                request,
+                pipeline.verify(_read_upload(resume), github_username)
+            )
+            
+        except HTTPException as e:
+            raise _with_profile_id(e, profile_id)
+        except JobQueueFullError as e:
+            raise _with_profile_id(HTTPException(status_code=503, detail=str(e)), profile_id)
+        except Exception as e:
+            raise _with_profile_id(_verification_error(e), profile_id)
+
+
+@router.post("/verify/stream")
+async def verify_resume_stream(
+    request: Request,
+    resume: UploadFile = File(...),
+    github_username: str = Form(...)
+):
+    """
+    Resume verification with progress, as Server-Sent Events.
+
+    - Uploads that are not PDFs or too large are rejected with 400 before
+      the stream starts, as on /verify
+    - resume_skills, github_profile, github_repos and github_languages
+      events are sent as each stage finishes
+    - The last event is result, carrying the same VerificationResponse as
+      /verify, or error with the status and detail /verify would give
+    
+    Profiled requests name their stack profile, which covers the whole
+    stream, in the X-Profile-Id response header.
+    """
+    with ExitStack() as stack:
+        profile_id = stack.enter_context(profiler.capture(request, "verify-stream"))
+        try:
+            if not file_handler.validate_file_extension(resume.filename):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Only PDF files are allowed"
+                )
+            pdf_bytes = await _read_upload(resume)
+            if not file_handler.validate_pdf_header(pdf_bytes):
+                raise NotAPdfError("Uploaded file is not a PDF")
+        except HTTPException as e:
+            raise _with_profile_id(e, profile_id)
+        except Exception as e:
+            raise _with_profile_id(_verification_error(e), profile_id)
+        # The stream now owns the profile capture. It is released when the
+        # stream ends, or by the background task if the client disconnects
+        # before the stream starts; closing it again is a no-op.
+        capture = stack.pop_all()
+
+    async def stream_events():
+        with capture:
+            async for event, data in pipeline.verify_events(pdf_bytes, github_username):
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if profile_id:
+        headers[PROFILE_ID_HEADER] = profile_id
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers=headers,
+        background=BackgroundTask(capture.close)
+    )
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get the status of a queued verification.
+    
+    - Status is queued, running, succeeded or failed
+    - Succeeded jobs include the verification result, failed jobs the error
+    """
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@router.post("/verify/batch")
+async def verify_batch(
+    resumes: List[UploadFile] = File(None),
+    github_usernames: List[str] = Form(None),
+    archive: Optional[UploadFile] = File(None)
+):
+    """
+    Verify many resumes against their GitHub profiles.
+    
+    - Upload resumes with matching github_usernames fields, or a zip
+      archive of PDFs with an optional manifest.json
+    - Results are streamed as NDJSON lines in completion order, each with
+      the item index and a status; failed items carry an error instead
+    """
+    if archive is not None:
+        try:
+            archive_bytes = await file_handler.read_upload_file(
+                archive,
+                max_size=settings.BATCH_MAX_ARCHIVE_SIZE
+            )
+            items = await asyncio.to_thread(file_handler.read_batch_archive, archive_bytes)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        resumes = resumes or []
+        github_usernames = github_usernames or []
+        if not resumes or len(resumes) != len(github_usernames):
             raise HTTPException(
                 status_code=400,
-                detail=f"File size exceeds {settings.MAX_FILE_SIZE / 1024 / 1024}MB limit"
+                detail="Provide one github_usernames value per resume, or an archive"
             )
-        
-        # Save and parse resume
-        pdf_path = await file_handler.save_upload_file(resume)
-        resume_data = await resume_parser.parse_pdf(pdf_path)
-        
-        # Extract skills from resume
-        resume_skills = skill_extractor.extract_skills(resume_data['text'])
-        
-        if not resume_skills:
+        if len(resumes) > settings.BATCH_MAX_ITEMS:
             raise HTTPException(
                 status_code=400,
-                detail="No technical skills found in resume"
+                detail=f"Batch exceeds {settings.BATCH_MAX_ITEMS} items"
             )
-        
-        # Verify GitHub profile
-        github_data = await github_verifier.verify_user(github_username)
-        github_skills = github_data['skills']
-        
-        # Calculate match score
-        matched_skills, match_percentage = scoring_engine.calculate_match_score(
-            resume_skills,
-            github_skills
-        )
-        
-        # Calculate trust score
-        trust_score = scoring_engine.calculate_trust_score(
-            match_percentage,
-            github_data['stats'],
-            len(resume_skills),
-            len(github_skills)
-        )
-        
-        # Determine risk level
-        risk_level = scoring_engine.determine_risk_level(trust_score, match_percentage)
-        
-        # Generate recommendations
-        unmatched_skills = [
-            skill for skill in resume_skills
-            if not any(m['found_in_github'] for m in matched_skills if m['skill'] == skill)
-        ]
-        recommendations = scoring_engine.generate_recommendations(
-            trust_score,
-            match_percentage,
-            github_data['stats'],
-            unmatched_skills
-        )
-        # Prepare github stats dictionary
-        github_stats = github_data['stats']
-        # Prepare response
-       
-
-# Prepare response
-        return VerificationResponse(
-    timestamp=datetime.utcnow().isoformat(),
-    resume_skills=resume_skills,
-    github_skills=github_skills,
-    matched_skills=matched_skills,
-    total_resume_skills=len(resume_skills),
-    total_github_skills=len(github_skills),
-    matched_count=len(matched_skills),
-    match_percentage=match_percentage,
-    trust_score=trust_score,
-    risk_level=risk_level,
-    recommendations=recommendations,
-    github_stats=github_stats
-)  
-       
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
+            
+        items = []
+        for resume, username in zip(resumes, github_usernames):
+            item = {'filename': resume.filename, 'github_username': username}
+            try:
+                if not file_handler.validate_file_extension(resume.filename):
+                    raise ValueError("Only PDF files are allowed")
+                item['content'] = await file_handler.read_upload_file(resume)
+            except ValueError as e:
+                item['error'] = str(e)
+            items.append(item)
+    
+    if len(items) > settings.BATCH_MAX_ITEMS:
         raise HTTPException(
-            status_code=500,
-            detail=f"Verification failed: {str(e)}"
+            status_code=400,
+            detail=f"Batch exceeds {settings.BATCH_MAX_ITEMS} items"
         )
+    
+    async def stream_results():
+        async for result in pipeline.verify_many(items):
+            yield json.dumps(result) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
 
 
 @router.post("/extract-skills")
-async def extract_skills_only(resume: UploadFile = File(...)):
+async def extract_skills_only(
+    request: Request,
+    response: Response,
+    resume: UploadFile = File(...)
+):
     """
     Extract skills from resume only.
     
     - Upload PDF resume
     - Extract and return technical skills
     """
-    try:
-        # Validate file
-        if not file_handler.validate_file_extension(resume.filename):
-            raise HTTPException(
-                status_code=400,
-                detail="Only PDF files are allowed"
-            )
-        
-        # Save and parse resume
-        pdf_path = await file_handler.save_upload_file(resume)
-        resume_data = await resume_parser.parse_pdf(pdf_path)
+    with profiler.capture(request, "extract-skills") as profile_id:
+        if profile_id:
+            response.headers[PROFILE_ID_HEADER] = profile_id
         
-        # Extract skills
-        skills = skill_extractor.extract_skills(resume_data['text'])
-        ranked_skills = skill_extractor.rank_skills(skills, resume_data['text'])
-        
-        return {
-            "skills": skills,
-            "ranked_skills": [
-                {"skill": skill, "frequency": count}
-                for skill, count in ranked_skills
-            ],
-            "total_skills": len(skills),
-            "word_count": resume_data['word_count']
-        }
-        
-    except HTTPException as e:
-        raise e
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Skill extraction failed: {str(e)}"
-        )
+        try:
+            # Validate file
+            if not file_handler.validate_file_extension(resume.filename):
+                raise HTTPException(
+                    status_code=400,
+                    detail="Only PDF files are allowed"
+                )
+            
+            # Read and parse resume in memory
+            pdf_bytes = await _read_upload(resume)
+            resume_data = await _run_until_disconnect(
+                request,
+                pipeline.parse_resume(pdf_bytes)
+            )
+            
+            # Extract skills with their frequencies in a single scan
+            with STAGE_DURATION.time('skill_extraction'):
+                occurrences = skill_extractor.extract_skill_occurrences(resume_data['text'])
+            skills = list(occurrences)
+            ranked_skills = skill_extractor.rank_skills(
+                skills,
+                resume_data['text'],
+                occurrences
+            )
+            
+            return {
+                "skills": skills,
+                "ranked_skills": [
+                    {
+                        "skill": skill,
+                        "frequency": count,
+                        "positions": occurrences[skill]['positions'],
+                        "sections": occurrences[skill]['sections']
+                    }
+                    for skill, count in ranked_skills
+                ],
+                "total_skills": len(skills),
+                "word_count": resume_data['word_count'],
+                "truncated": resume_data['truncated']
+            }
+            
+        except HTTPException as e:
+            raise _with_profile_id(e, profile_id)
+        except FileTooLargeError as e:
+            raise _with_profile_id(HTTPException(status_code=400, detail=str(e)), profile_id)
+        except Exception as e:
+            raise _with_profile_id(
+                HTTPException(
+                    status_code=500,
+                    detail=f"Skill extraction failed: {str(e)}"
+                ),
+                profile_id
+            )
 
 
 @router.get("/github-profile/{username}")
@@ -185,6 +392,8 @@ async def get_github_profile(username: str):
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except GitHubRateLimitError as e:
+        raise _rate_limited(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -198,7 +407,14 @@ async def health_check():
     return {
         "status": "healthy",
         "service": settings.APP_NAME,
-        "version": settings.APP_VERSION
+        "version": settings.APP_VERSION,
+        "github_pool": github_verifier.get_pool_stats(),
+        "github_cache": github_verifier.cache.get_stats(),
+        "github_inflight": github_verifier.inflight.get_stats(),
+        "github_quota": github_verifier.token_pool.get_quota(),
+        "github_snapshots": github_verifier.snapshots.get_stats() if github_verifier.snapshots else None,
+        "resume_cache": resume_parser.cache.get_stats(),
+        "jobs": await job_queue.get_stats()
     }
 @router.post("/interview-questions")
 async def generate_questions(skills: list[str]):
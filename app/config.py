@@ -16,15 +16,83 @@ class Settings(BaseSettings):
     # GitHub API
     GITHUB_API_URL: str = "https://api.github.com"
     GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")
+    GITHUB_TOKENS: List[str] = []  # extra tokens to rotate through (JSON list)
+    GITHUB_RATE_LIMIT_RESERVE: int = 0  # requests kept in reserve per token
+    GITHUB_RATE_LIMIT_MAX_WAIT: float = 60.0  # seconds to wait for quota
+    GITHUB_RATE_LIMIT_RETRIES: int = 2
+    GITHUB_FETCH_BACKEND: str = "rest"  # "rest" or "graphql" (requires a token)
+    GITHUB_GRAPHQL_URL: str = ""  # defaults to {GITHUB_API_URL}/graphql
+    GITHUB_GRAPHQL_USERS_PER_QUERY: int = 10  # aliased users per GraphQL query
+    
+    # GitHub HTTP connection pool
+    GITHUB_POOL_LIMIT: int = 100
+    GITHUB_POOL_LIMIT_PER_HOST: int = 20
+    GITHUB_DNS_CACHE_TTL: int = 300  # seconds
+    GITHUB_KEEPALIVE_TIMEOUT: float = 30.0  # seconds
+    GITHUB_CONNECT_TIMEOUT: float = 5.0  # seconds
+    GITHUB_REQUEST_TIMEOUT: float = 30.0  # seconds
+    GITHUB_FANOUT_CONCURRENCY: int = 8  # parallel requests per verification
+    
+    # GitHub response cache (stale entries are revalidated with ETags)
+    GITHUB_CACHE_TTL: float = 300.0  # seconds
+    GITHUB_CACHE_MAX_ENTRIES: int = 2048
+    GITHUB_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+    
+    # GitHub profile snapshots for incremental refresh (empty disables)
+    GITHUB_SNAPSHOT_DB: str = ""
+    GITHUB_SNAPSHOT_MAX_AGE: float = 7 * 24 * 3600.0  # seconds before a full refresh
     
     # File Upload
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
     ALLOWED_EXTENSIONS: List[str] = [".pdf"]
     
+    # PDF parsing pool
+    PDF_EXECUTOR: str = "process"  # "process" or "thread"
+    PDF_WORKERS: int = 2
+    PDF_PARSE_TIMEOUT: float = 30.0  # seconds per document
+    PDF_MAX_PAGES: int = 50
+    PDF_MAX_CHARS: int = 200_000
+    PDF_PAGE_TIME_BUDGET: float = 2.0  # stop after a page slower than this
+    
+    # Batch verification
+    BATCH_MAX_ITEMS: int = 200
+    BATCH_MAX_ARCHIVE_SIZE: int = 100 * 1024 * 1024  # 100MB
+    BATCH_MAX_UNCOMPRESSED_SIZE: int = 256 * 1024 * 1024  # 256MB of resumes per archive
+    BATCH_PARSE_CONCURRENCY: int = 4
+    BATCH_GITHUB_CONCURRENCY: int = 8
+    
+    # Background verification jobs (POST /verify?async=true)
+    JOB_DB_PATH: str = "/tmp/resume_uploads/jobs.db"
+    JOB_WORKERS: int = 2
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY: float = 5.0  # seconds, doubled on each retry
+    JOB_RESULT_TTL: float = 3600.0  # seconds
+    JOB_MAX_QUEUED: int = 1000
+    JOB_LEASE_TIME: float = 60.0  # seconds a running job stays claimed without renewal
+    
+    # Request profiling (sampled stacks written as collapsed-stack files)
+    PROFILE_SAMPLE_RATE: float = 0.0  # fraction of requests to profile
+    PROFILE_ADMIN_TOKEN: str = ""  # profiles requests sending it in X-Profile-Token
+    PROFILE_INTERVAL: float = 0.005  # seconds between stack samples
+    PROFILE_DIR: str = "/tmp/resume_uploads/profiles"
+    PROFILE_MAX_FILES: int = 100
+    PROFILE_MAX_BYTES: int = 50 * 1024 * 1024  # 50MB
+    
     # Scoring Thresholds
     HIGH_MATCH_THRESHOLD: float = 0.7
     MEDIUM_MATCH_THRESHOLD: float = 0.4
     
+    # Skill taxonomy (JSON file and binary snapshot; empty uses the built-in set)
+    SKILL_TAXONOMY_PATH: str = ""
+    SKILL_TAXONOMY_SNAPSHOT: str = ""
+    
+    # Resume cache (parsed text and skills, keyed by content hash)
+    RESUME_CACHE_MAX_ENTRIES: int = 512
+    RESUME_CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # 64MB
+    RESUME_CACHE_DIR: str = ""  # optional on-disk tier
+    RESUME_CACHE_DISK_MAX_ENTRIES: int = 10_000
+    RESUME_CACHE_DISK_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB
+    
     # Temporary file storage
     TEMP_DIR: str = "/tmp/resume_uploads"
     
@@ -2,13 +2,25 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
 import logging
 from pathlib import Path
+from typing import List
 
 from app.config import settings
-from app.api.endpoints import router
+from app.api.endpoints import router, github_verifier, resume_parser, job_queue
+from app.utils.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_REQUEST_DURATION,
+    Gauge,
+    Metric,
+    MetricsMiddleware,
+    registry,
+    stats_metrics,
+)
+from app.utils.skill_database import get_skill_taxonomy
 
 
 # Configure logging
@@ -28,10 +40,27 @@ async def lifespan(app: FastAPI):
     # Create temp directory
     Path(settings.TEMP_DIR).mkdir(parents=True, exist_ok=True)
     
+    # Build the skill taxonomy index before serving requests
+    taxonomy = get_skill_taxonomy()
+    logger.info(
+        f"Loaded skill taxonomy {taxonomy.version[:12]} "
+        f"with {len(taxonomy.skills)} skills"
+    )
+    
+    # Open the shared GitHub connection pool and the PDF worker pool
+    await github_verifier.start()
+    resume_parser.pdf_executor.start()
+    
+    # Resume queued verification jobs
+    await job_queue.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application")
+    await job_queue.stop()
+    await github_verifier.close()
+    resume_parser.pdf_executor.shutdown()
 
 
 # Create FastAPI instance
@@ -53,10 +82,64 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count responses and requests in flight
+app.add_middleware(
+    MetricsMiddleware,
+    requests=HTTP_REQUESTS,
+    in_flight=HTTP_REQUESTS_IN_FLIGHT,
+    duration=HTTP_REQUEST_DURATION,
+)
+
 # Include routers
 app.include_router(router, prefix="/api/v1", tags=["verification"])
 
 
+def collect_service_metrics() -> List[Metric]:
+    """Read cache and quota state for the metrics endpoint."""
+    metrics = stats_metrics(
+        'trusthire_github_cache',
+        'GitHub response cache events.',
+        github_verifier.cache.get_stats(),
+        ('hits', 'misses', 'revalidations', 'evictions'),
+        {'entries': 'entries', 'bytes': 'bytes'},
+    )
+    metrics += stats_metrics(
+        'trusthire_github_inflight',
+        'GitHub profile fetches started, coalesced with one in flight, and abandoned by every caller.',
+        github_verifier.inflight.get_stats(),
+        ('started', 'coalesced', 'abandoned'),
+        {'in_flight': 'in_flight'},
+    )
+    metrics += stats_metrics(
+        'trusthire_resume_cache',
+        'Resume cache events.',
+        resume_parser.cache.get_stats(),
+        ('hits', 'disk_hits', 'misses', 'evictions'),
+        {'entries': 'entries', 'bytes': 'bytes'},
+    )
+    
+    quota = github_verifier.token_pool.get_quota()
+    metrics += stats_metrics(
+        'trusthire_github_rate_limit',
+        'GitHub requests delayed or rejected by rate limits.',
+        quota,
+        ('throttled', 'rate_limited'),
+    )
+    remaining = Gauge(
+        'trusthire_github_rate_limit_remaining',
+        'GitHub API requests left in the current window, per token.',
+        ('token',),
+    )
+    for token in quota['tokens']:
+        if token['remaining'] is not None:
+            remaining.set(token['remaining'], token['token'])
+    metrics.append(remaining)
+    return metrics
+
+
+registry.add_collector(collect_service_metrics)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -67,6 +150,19 @@ async def root():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    # Job counts come from the queue database, read off the event loop
+    jobs = Gauge('trusthire_jobs', 'Verification jobs by status.', ('status',))
+    for status, count in (await job_queue.get_stats()).items():
+        jobs.set(count, status)
+    return PlainTextResponse(
+        registry.render(extra=[jobs]),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 @app.exception_handler(404)
 async def not_found(request, exc):
     """Handle 404 errors."""
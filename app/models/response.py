@@ -29,6 +29,7 @@ class VerificationResponse(BaseModel):
     risk_level: str
     recommendations: List[str]
     github_stats: Dict
+    resume_truncated: bool = False
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,190 @@
+"""GitHub GraphQL fetch backend."""
+
+import asyncio
+import json
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+
+import aiohttp
+
+
+# REST-shaped user data, repositories, and per-repo language bytes keyed by repo name
+Profile = Tuple[Dict[str, Any], List[Dict[str, Any]], Dict[str, Dict[str, int]]]
+
+# Sends an authenticated request: request(session, method, url, **kwargs)
+RequestFunc = Callable[..., AsyncContextManager[aiohttp.ClientResponse]]
+
+
+class GitHubGraphQLClient:
+    """Fetch GitHub profiles through the GraphQL v4 API.
+
+    One aliased query returns the profile and a page of repositories,
+    with their primary language, language sizes and topics, for several
+    users at once. Users are split into groups of users_per_query so a
+    query stays well under GitHub's limit of 500,000 nodes; each user
+    costs about repos_per_page * (TOPICS_PER_REPO + LANGUAGES_PER_REPO)
+    nodes. Results are converted to the shapes returned by the REST
+    endpoints so GitHubVerifier can analyze them unchanged.
+    """
+
+    LANGUAGES_PER_REPO = 10
+    TOPICS_PER_REPO = 20
+
+    def __init__(
+        self,
+        url: str,
+        request: RequestFunc,
+        repos_per_page: int = 100,
+        max_repos: int = 300,
+        users_per_query: int = 10
+    ):
+        self.url = url
+        self.request = request
+        self.repos_per_page = repos_per_page
+        self.max_repos = max_repos
+        self.users_per_query = max(users_per_query, 1)
+
+    async def fetch_profiles(
+        self,
+        session: aiohttp.ClientSession,
+        usernames: List[str]
+    ) -> Dict[str, Optional[Profile]]:
+        """Fetch several profiles, paging repositories with batched queries.
+
+        Groups of users_per_query users are fetched concurrently. Returns a
+        profile per username, or None for users that do not exist.
+        """
+        groups = await asyncio.gather(*(
+            self._fetch_group(session, usernames[start:start + self.users_per_query])
+            for start in range(0, len(usernames), self.users_per_query)
+        ))
+        return {username: profile for group in groups for username, profile in group.items()}
+
+    async def _fetch_group(
+        self,
+        session: aiohttp.ClientSession,
+        usernames: List[str]
+    ) -> Dict[str, Optional[Profile]]:
+        """Fetch a group of profiles, one aliased query per page of repositories."""
+        profiles: Dict[str, Optional[Profile]] = {}
+        cursors: Dict[str, Optional[str]] = {username: None for username in usernames}
+
+        while cursors:
+            aliases = {f'u{index}': username for index, username in enumerate(cursors)}
+            data = await self._query(session, self._build_query(aliases, cursors))
+
+            next_cursors: Dict[str, Optional[str]] = {}
+            for alias, username in aliases.items():
+                node = data.get(alias)
+                if node is None:
+                    profiles[username] = None
+                    continue
+
+                if username not in profiles:
+                    profiles[username] = (self._convert_user(node), [], {})
+                _, repos, repo_languages = profiles[username]
+
+                connection = node['repositories']
+                for repo_node in connection['nodes']:
+                    repo, languages = self._convert_repository(repo_node)
+                    repos.append(repo)
+                    repo_languages[repo['name']] = languages
+
+                page_info = connection['pageInfo']
+                if page_info['hasNextPage'] and len(repos) < self.max_repos:
+                    next_cursors[username] = page_info['endCursor']
+            cursors = next_cursors
+
+        return profiles
+
+    def _build_query(self, aliases: Dict[str, str], cursors: Dict[str, Optional[str]]) -> str:
+        """Build an aliased query for a page of each user's repositories."""
+        fields = []
+        for alias, username in aliases.items():
+            cursor = cursors[username]
+            after = f', after: {json.dumps(cursor)}' if cursor else ''
+            fields.append(
+                f'{alias}: user(login: {json.dumps(username)}) {{\n'
+                f'  ...ProfileFields\n'
+                f'  repositories(first: {self.repos_per_page}{after}, ownerAffiliations: OWNER, '
+                f'privacy: PUBLIC, orderBy: {{field: UPDATED_AT, direction: DESC}}) {{\n'
+                f'    ...RepositoryPage\n'
+                f'  }}\n'
+                f'}}'
+            )
+
+        return (
+            'query {\n' + '\n'.join(fields) + '\n}\n'
+            'fragment ProfileFields on User {\n'
+            '  login name createdAt\n'
+            '  followers { totalCount }\n'
+            '  following { totalCount }\n'
+            '}\n'
+            'fragment RepositoryPage on RepositoryConnection {\n'
+            '  totalCount\n'
+            '  pageInfo { hasNextPage endCursor }\n'
+            '  nodes {\n'
+            '    name description stargazerCount forkCount updatedAt pushedAt\n'
+            '    owner { login }\n'
+            '    primaryLanguage { name }\n'
+            f'    repositoryTopics(first: {self.TOPICS_PER_REPO}) {{ nodes {{ topic {{ name }} }} }}\n'
+            f'    languages(first: {self.LANGUAGES_PER_REPO}, '
+            'orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }\n'
+            '  }\n'
+            '}\n'
+        )
+
+    async def _query(
+        self,
+        session: aiohttp.ClientSession,
+        query: str
+    ) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data object."""
+        async with self.request(session, 'POST', self.url, json={'query': query}) as response:
+            if response.status != 200:
+                raise Exception(f"GitHub API error: {response.status}")
+            payload = await response.json()
+
+        # Missing users are reported as NOT_FOUND errors next to a null alias
+        errors = [
+            error for error in payload.get('errors') or []
+            if error.get('type') != 'NOT_FOUND'
+        ]
+        if errors:
+            raise Exception(f"GitHub GraphQL error: {errors[0].get('message')}")
+        return payload.get('data') or {}
+
+    @staticmethod
+    def _convert_user(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a GraphQL user node to the REST user shape."""
+        return {
+            'login': node.get('login'),
+            'name': node.get('name'),
+            'public_repos': node['repositories']['totalCount'],
+            'followers': node['followers']['totalCount'],
+            'following': node['following']['totalCount'],
+            'created_at': node.get('createdAt'),
+        }
+
+    @staticmethod
+    def _convert_repository(node: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Convert a GraphQL repository node to the REST repo and languages shapes."""
+        primary_language = node.get('primaryLanguage') or {}
+        repo = {
+            'name': node['name'],
+            'description': node.get('description'),
+            'language': primary_language.get('name'),
+            'stargazers_count': node.get('stargazerCount', 0),
+            'forks_count': node.get('forkCount', 0),
+            'updated_at': node.get('updatedAt'),
+            'pushed_at': node.get('pushedAt'),
+            'owner': {'login': (node.get('owner') or {}).get('login')},
+            'topics': [
+                topic_node['topic']['name']
+                for topic_node in (node.get('repositoryTopics') or {}).get('nodes', [])
+            ],
+        }
+        languages = {
+            edge['node']['name']: edge['size']
+            for edge in (node.get('languages') or {}).get('edges', [])
+        }
+        return repo, languages
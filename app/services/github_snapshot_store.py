@@ -0,0 +1,114 @@
+"""Persistent snapshots of analyzed GitHub profiles."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+class GitHubSnapshotStore:
+    """Keep the last fetched state of each GitHub user in SQLite.
+
+    A snapshot holds the profile fields, compact repository records and
+    the language bytes of the repositories whose languages were fetched.
+    GitHubVerifier uses it to refresh a returning user incrementally
+    instead of refetching the whole profile. Database calls run in a
+    thread so they do not block the event loop.
+    """
+
+    # Profile and repository fields used by the analysis
+    USER_FIELDS = ('login', 'name', 'public_repos', 'followers', 'following', 'created_at')
+    REPO_FIELDS = (
+        'name', 'description', 'language', 'stargazers_count', 'forks_count',
+        'updated_at', 'pushed_at', 'topics',
+    )
+
+    def __init__(self, path: str, max_age: float = 7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._db: Optional[sqlite3.Connection] = None
+        # One connection is shared by the threads running database calls
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'incremental': 0, 'full': 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the snapshot database on first use."""
+        if self._db is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    username TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+        return self._db
+
+    def close(self) -> None:
+        """Close the snapshot database."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a database call in a thread, one at a time."""
+        def locked() -> Any:
+            with self._lock:
+                return func(*args)
+        return await asyncio.to_thread(locked)
+
+    @classmethod
+    def compact_repo(cls, repo: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the repository fields the analysis needs."""
+        record = {field: repo[field] for field in cls.REPO_FIELDS if field in repo}
+        record['owner'] = {'login': (repo.get('owner') or {}).get('login')}
+        return record
+
+    async def get(self, username: str) -> Optional[Dict[str, Any]]:
+        """Get a user's snapshot, or None if there is none or it is too old."""
+        row = await self._call(self._select, username.lower())
+        if row is None or time.time() - row[1] > self.max_age:
+            self.stats['misses'] += 1
+            return None
+        self.stats['hits'] += 1
+        return json.loads(row[0])
+
+    async def put(
+        self,
+        username: str,
+        user_data: Dict[str, Any],
+        repos: List[Dict[str, Any]],
+        repo_languages: Dict[str, Dict[str, int]]
+    ) -> None:
+        """Store a user's snapshot, replacing the previous one."""
+        data = {
+            'user': {field: user_data.get(field) for field in self.USER_FIELDS},
+            'repos': [self.compact_repo(repo) for repo in repos],
+            'repo_languages': repo_languages,
+        }
+        await self._call(self._replace, username.lower(), json.dumps(data))
+
+    def _select(self, username: str) -> Optional[tuple]:
+        return self._connect().execute(
+            "SELECT data, fetched_at FROM snapshots WHERE username = ?",
+            (username,)
+        ).fetchone()
+
+    def _replace(self, username: str, data: str) -> None:
+        self._connect().execute(
+            "INSERT OR REPLACE INTO snapshots (username, data, fetched_at) VALUES (?, ?, ?)",
+            (username, data, time.time())
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get snapshot lookup and refresh counters."""
+        return dict(self.stats)
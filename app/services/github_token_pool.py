@@ -0,0 +1,146 @@
+"""Rate-limit-aware scheduling of GitHub API requests across tokens."""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+
+class GitHubRateLimitError(Exception):
+    """Raised when no token has quota within the allowed wait time."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenState:
+    """Quota known for one GitHub token."""
+
+    __slots__ = ('token', 'limit', 'remaining', 'reset_at', 'blocked_until')
+
+    def __init__(self, token: str):
+        self.token = token
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Authorization headers for requests made with this token."""
+        return {'Authorization': f'token {self.token}'} if self.token else {}
+
+    def available_at(self, reserve: int) -> float:
+        """Get the earliest time this token may be used again."""
+        if self.remaining is not None and self.remaining <= reserve:
+            return max(self.blocked_until, self.reset_at)
+        return self.blocked_until
+
+
+class GitHubTokenPool:
+    """Track remaining quota per token and pick a token for each request.
+
+    Quota comes from the X-RateLimit-* headers of every response. Requests
+    go to the token with the most quota left; when every token is exhausted
+    or blocked by a Retry-After, callers wait for the earliest reset
+    instead of failing, up to max_wait seconds.
+    """
+
+    SECONDARY_LIMIT_DELAY = 60.0  # seconds, when GitHub sends no Retry-After
+
+    def __init__(self, tokens: List[str], reserve: int = 0, max_wait: float = 60.0):
+        self.states = [TokenState(token) for token in tokens] or [TokenState('')]
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.stats = {'throttled': 0, 'rate_limited': 0}
+
+    async def acquire(self) -> TokenState:
+        """Pick the token with the most quota, waiting while none has any."""
+        deadline = time.time() + self.max_wait
+        throttled = False
+        while True:
+            now = time.time()
+            for state in self.states:
+                if state.remaining is not None and state.reset_at <= now:
+                    # The rate-limit window has reset
+                    state.remaining = None
+
+            available = [
+                state for state in self.states
+                if state.available_at(self.reserve) <= now
+            ]
+            if available:
+                state = max(
+                    available,
+                    key=lambda s: float('inf') if s.remaining is None else s.remaining
+                )
+                if state.remaining is not None:
+                    # Reserve quota for this request until its headers arrive
+                    state.remaining -= 1
+                return state
+
+            wake_at = min(state.available_at(self.reserve) for state in self.states)
+            if wake_at > deadline:
+                raise GitHubRateLimitError(
+                    "GitHub API rate limit exhausted for all tokens",
+                    retry_after=max(wake_at - now, 0)
+                )
+            if not throttled:
+                self.stats['throttled'] += 1
+                throttled = True
+            await asyncio.sleep(max(wake_at - now, 0.01))
+
+    def update(self, state: TokenState, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Record quota from a response.
+
+        Returns the delay before retrying if the response was rate limited,
+        or None otherwise.
+        """
+        now = time.time()
+        if 'X-RateLimit-Remaining' in headers:
+            try:
+                state.remaining = int(headers['X-RateLimit-Remaining'])
+                state.limit = int(headers.get('X-RateLimit-Limit', state.limit or 0))
+                state.reset_at = float(headers.get('X-RateLimit-Reset', state.reset_at))
+            except ValueError:
+                pass
+
+        if status not in (403, 429):
+            return None
+
+        if 'Retry-After' in headers:
+            # Secondary rate limit
+            try:
+                delay = float(headers['Retry-After'])
+            except ValueError:
+                delay = self.SECONDARY_LIMIT_DELAY
+        elif state.remaining == 0:
+            delay = max(state.reset_at - now, 0)
+        elif status == 429:
+            delay = self.SECONDARY_LIMIT_DELAY
+        else:
+            # A plain 403 is a permission error, not a rate limit
+            return None
+
+        state.blocked_until = now + delay
+        self.stats['rate_limited'] += 1
+        return delay
+
+    def get_quota(self) -> Dict[str, Any]:
+        """Get the current quota of every token for monitoring."""
+        now = time.time()
+        tokens = [
+            {
+                'token': f'...{state.token[-4:]}' if state.token else 'anonymous',
+                'limit': state.limit,
+                'remaining': state.remaining,
+                'reset_in': max(round(state.reset_at - now), 0) if state.reset_at else None,
+                'blocked_for': max(round(state.blocked_until - now), 0),
+            }
+            for state in self.states
+        ]
+        return {
+            **self.stats,
+            'remaining': sum(state.remaining or 0 for state in self.states),
+            'tokens': tokens,
+        }
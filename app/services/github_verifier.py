@@ -2,117 +2,660 @@
 
 import aiohttp
 import asyncio
-from typing import Dict, List, Any, Optional
+import json
+import re
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Any, Mapping, Optional, Set, Tuple
 from datetime import datetime, timedelta
+from urllib.parse import urlencode
 from app.config import settings
-from app.utils.skill_database import SkillDatabase
+from app.services.github_graphql import GitHubGraphQLClient
+from app.services.github_snapshot_store import GitHubSnapshotStore
+from app.services.github_token_pool import GitHubRateLimitError, GitHubTokenPool
+from app.utils.metrics import GITHUB_REQUEST_DURATION, GITHUB_REQUESTS
+from app.utils.response_cache import ResponseCache
+from app.utils.single_flight import SingleFlight
+from app.utils.skill_database import get_skill_taxonomy
+from app.utils.skill_matcher import SkillMatcher
+
+
+# Called with an event name and its data as a profile fetch progresses
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
 
 
 class GitHubVerifier:
     """Verify skills through GitHub profile analysis."""
     
+    REPOS_PER_PAGE = 100
+    MAX_REPOS = 300  # Limit to 300 repos to avoid rate limiting
+    CACHED_HEADERS = ('Link',)
+    
+    # Keywords in repo metadata that point to a skill
+    KEYWORD_PATTERNS = {
+        'docker': ['docker', 'containerized', 'dockerfile'],
+        'kubernetes': ['k8s', 'kubernetes', 'kubectl'],
+        'react': ['react', 'jsx', 'next.js', 'nextjs', 'gatsby'],
+        'vue': ['vue', 'nuxt', 'vuex'],
+        'angular': ['angular', 'ng-', 'ngrx'],
+        'django': ['django'],
+        'flask': ['flask'],
+        'fastapi': ['fastapi', 'fast-api'],
+        'spring': ['spring', 'springboot', 'spring-boot'],
+        'aws': ['aws', 'amazon', 's3', 'ec2', 'lambda'],
+        'machine learning': ['ml', 'machine-learning', 'tensorflow', 'pytorch', 'scikit'],
+        'data science': ['data-science', 'pandas', 'numpy', 'jupyter'],
+    }
+    
     def __init__(self):
         self.base_url = settings.GITHUB_API_URL
         self.headers = {
             'Accept': 'application/vnd.github.v3+json'
         }
-        if settings.GITHUB_TOKEN:
-            self.headers['Authorization'] = f'token {settings.GITHUB_TOKEN}'
-        self.skill_db = SkillDatabase()
-    
-    async def verify_user(self, username: str) -> Dict[str, Any]:
-        """Fetch and analyze GitHub user profile."""
-        async with aiohttp.ClientSession() as session:
-            # Fetch user profile
-            user_data = await self._fetch_user(session, username)
+        tokens = [settings.GITHUB_TOKEN] if settings.GITHUB_TOKEN else []
+        tokens += [token for token in settings.GITHUB_TOKENS if token not in tokens]
+        self.token_pool = GitHubTokenPool(
+            tokens,
+            reserve=settings.GITHUB_RATE_LIMIT_RESERVE,
+            max_wait=settings.GITHUB_RATE_LIMIT_MAX_WAIT,
+        )
+        self.taxonomy = get_skill_taxonomy()
+        self.repo_skill_matcher, self.repo_term_skills = self._build_repo_skill_matcher()
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.cache = ResponseCache(
+            ttl=settings.GITHUB_CACHE_TTL,
+            max_entries=settings.GITHUB_CACHE_MAX_ENTRIES,
+            max_bytes=settings.GITHUB_CACHE_MAX_BYTES,
+        )
+        self.inflight = SingleFlight()
+        # Lowercased username -> progress callbacks of the callers waiting on it
+        self._progress: Dict[str, List[ProgressCallback]] = {}
+        self.snapshots = GitHubSnapshotStore(
+            settings.GITHUB_SNAPSHOT_DB,
+            max_age=settings.GITHUB_SNAPSHOT_MAX_AGE,
+        ) if settings.GITHUB_SNAPSHOT_DB else None
+        self.graphql = GitHubGraphQLClient(
+            settings.GITHUB_GRAPHQL_URL or f"{self.base_url}/graphql",
+            self._request,
+            repos_per_page=self.REPOS_PER_PAGE,
+            max_repos=self.MAX_REPOS,
+            users_per_query=settings.GITHUB_GRAPHQL_USERS_PER_QUERY,
+        )
+        self.pool_counters = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+        }
+    
+    async def start(self) -> None:
+        """Open the shared HTTP session used for all GitHub requests."""
+        if self.session is None or self.session.closed:
+            self.session = self._create_session()
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.snapshots is not None:
+            self.snapshots.close()
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with a tuned connection pool."""
+        connector = aiohttp.TCPConnector(
+            limit=settings.GITHUB_POOL_LIMIT,
+            limit_per_host=settings.GITHUB_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=settings.GITHUB_DNS_CACHE_TTL,
+            keepalive_timeout=settings.GITHUB_KEEPALIVE_TIMEOUT,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.GITHUB_REQUEST_TIMEOUT,
+            connect=settings.GITHUB_CONNECT_TIMEOUT,
+        )
+        
+        trace_config = aiohttp.TraceConfig()
+        for signal, counter in (
+            (trace_config.on_request_start, 'requests'),
+            (trace_config.on_connection_create_end, 'connections_created'),
+            (trace_config.on_connection_reuseconn, 'connections_reused'),
+            (trace_config.on_dns_cache_hit, 'dns_cache_hits'),
+            (trace_config.on_dns_cache_miss, 'dns_cache_misses'),
+        ):
+            signal.append(self._make_counter_callback(counter))
+        
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            trace_configs=[trace_config],
+        )
+    
+    def _make_counter_callback(self, counter: str):
+        """Create a trace callback that increments a pool counter."""
+        async def callback(session, trace_config_ctx, params):
+            self.pool_counters[counter] += 1
+        return callback
+    
+    @asynccontextmanager
+    async def _session_scope(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared session, or a temporary one outside the app lifespan."""
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with self._create_session() as session:
+                yield session
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Get connection pool usage statistics for monitoring."""
+        stats: Dict[str, Any] = {'active': False, **self.pool_counters}
+        if self.session is None or self.session.closed:
+            return stats
+        
+        connector = self.session.connector
+        stats.update({
+            'active': True,
+            'limit': connector.limit,
+            'limit_per_host': connector.limit_per_host,
+            # aiohttp exposes no public counters for pooled connections
+            'in_use': len(getattr(connector, '_acquired', ())),
+            'idle': sum(len(conns) for conns in getattr(connector, '_conns', {}).values()),
+        })
+        return stats
+    
+    @asynccontextmanager
+    async def _request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a GitHub request with a pooled token, waiting out rate limits.
+        
+        Rate-limited responses mark their token as blocked and the request
+        is retried on the next available token, up to
+        GITHUB_RATE_LIMIT_RETRIES times; after that GitHubRateLimitError is
+        raised.
+        """
+        endpoint = self._endpoint_class(url)
+        with GITHUB_REQUEST_DURATION.time(endpoint):
+            attempt = 0
+            while True:
+                token = await self.token_pool.acquire()
+                request_headers = {**self.headers, **token.headers, **(headers or {})}
+                async with session.request(method, url, headers=request_headers, **kwargs) as response:
+                    GITHUB_REQUESTS.inc(endpoint, str(response.status))
+                    retry_delay = self.token_pool.update(token, response.status, response.headers)
+                    if retry_delay is None:
+                        yield response
+                        return
+                    if attempt >= settings.GITHUB_RATE_LIMIT_RETRIES:
+                        raise GitHubRateLimitError(
+                            f"GitHub API rate limited after {attempt + 1} attempts",
+                            retry_after=retry_delay
+                        )
+                attempt += 1
+    
+    def _endpoint_class(self, url: str) -> str:
+        """Classify a GitHub API URL for metrics."""
+        if url == self.graphql.url:
+            return 'graphql'
+        if url.endswith('/languages'):
+            return 'languages'
+        if url.endswith('/repos'):
+            return 'repos'
+        if url.startswith(f"{self.base_url}/users/"):
+            return 'user'
+        return 'other'
+    
+    async def _get_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[int, Any, Mapping[str, str]]:
+        """GET a GitHub API resource through the response cache.
+        
+        Fresh entries are served without a request; stale ones are
+        revalidated with If-None-Match, and a 304 is answered from the
+        cache. Returns the status, the decoded body (None unless 200)
+        and the response headers.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        cached = self.cache.get(key)
+        if cached is not None and cached.is_fresh():
+            self.cache.stats['hits'] += 1
+            return 200, cached.data, cached.headers
+        
+        headers = {}
+        if cached is not None and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        
+        async with self._request(session, 'GET', url, headers, params=params) as response:
+            if response.status == 304 and cached is not None:
+                self.cache.stats['revalidations'] += 1
+                self.cache.renew(key)
+                return 200, cached.data, cached.headers
+            
+            if response.status != 200:
+                return response.status, None, response.headers
+            
+            body = await response.read()
+            data = json.loads(body)
+            self.cache.stats['misses'] += 1
+            self.cache.put(
+                key,
+                data,
+                response.headers.get('ETag'),
+                {
+                    name: response.headers[name]
+                    for name in self.CACHED_HEADERS
+                    if name in response.headers
+                },
+                len(body),
+            )
+            return 200, data, response.headers
+    
+    async def verify_user(
+        self,
+        username: str,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Fetch and analyze GitHub user profile.
+        
+        Concurrent calls for the same username share one fetch. progress
+        is called with github_profile, github_repos and github_languages
+        events as those parts of the profile arrive; a call that joins a
+        fetch in flight only gets the events still to come.
+        """
+        key = username.lower()
+        if progress is not None:
+            self._progress.setdefault(key, []).append(progress)
+        try:
+            return await self.inflight.do(key, lambda: self._verify_user(username))
+        finally:
+            if progress is not None:
+                self._progress[key].remove(progress)
+                if not self._progress[key]:
+                    del self._progress[key]
+    
+    def _report(self, username: str, event: str, data: Dict[str, Any]) -> None:
+        """Send a progress event to the callers waiting on a user's profile."""
+        for callback in list(self._progress.get(username.lower(), ())):
+            callback(event, data)
+    
+    def _report_profile(self, username: str, user_data: Dict) -> None:
+        self._report(username, 'github_profile', {
+            'username': user_data.get('login'),
+            'name': user_data.get('name'),
+            'public_repos': user_data.get('public_repos', 0),
+            'followers': user_data.get('followers', 0),
+        })
+    
+    def _report_repos(self, username: str, repos: List[Dict]) -> None:
+        self._report(username, 'github_repos', {'count': len(repos)})
+    
+    def _report_languages(self, username: str, languages: Dict[str, float]) -> None:
+        self._report(username, 'github_languages', {
+            'languages': sorted(languages, key=languages.get, reverse=True),
+        })
+    
+    @property
+    def batch_size(self) -> int:
+        """Get how many users verify_users fetches together, 1 if it does not batch."""
+        if settings.GITHUB_FETCH_BACKEND != 'graphql':
+            return 1
+        return self.graphql.users_per_query
+    
+    async def verify_users(self, usernames: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch and analyze several GitHub profiles.
+        
+        With the GraphQL backend users are fetched in aliased queries of
+        batch_size users per page of repositories. Returns None for
+        missing users.
+        """
+        if settings.GITHUB_FETCH_BACKEND != 'graphql':
+            results = await asyncio.gather(
+                *(self.verify_user(username) for username in usernames),
+                return_exceptions=True
+            )
+            verified = {}
+            for username, result in zip(usernames, results):
+                if isinstance(result, ValueError):
+                    result = None
+                elif isinstance(result, BaseException):
+                    raise result
+                verified[username] = result
+            return verified
+        
+        async with self._session_scope() as session:
+            profiles = await self.graphql.fetch_profiles(session, usernames)
+        return {
+            username: self._build_graphql_result(profile) if profile else None
+            for username, profile in profiles.items()
+        }
+    
+    def _stop_if_abandoned(self, username: str) -> None:
+        """Stop a fetch between stages once no caller is waiting for it.
+        
+        Only called when none of the fetch's requests are in flight:
+        cancelling an aiohttp request midway breaks the next request on
+        its pooled connection.
+        """
+        if not self.inflight.has_waiters(username.lower()):
+            raise asyncio.CancelledError()
+    
+    async def _verify_user(self, username: str) -> Dict[str, Any]:
+        """Fetch and analyze GitHub user profile without coalescing."""
+        self._stop_if_abandoned(username)
+        async with self._session_scope() as session:
+            if settings.GITHUB_FETCH_BACKEND == 'graphql':
+                profiles = await self.graphql.fetch_profiles(session, [username])
+                if not profiles.get(username):
+                    raise ValueError(f"GitHub user '{username}' not found")
+                user_data, repos, _ = profiles[username]
+                self._report_profile(username, user_data)
+                self._report_repos(username, repos)
+                result = self._build_graphql_result(profiles[username])
+                self._report_languages(username, result['languages'])
+                return result
+            
+            if self.snapshots is not None:
+                return await self._verify_user_incremental(session, username)
+            
+            # Fetch user profile and repositories concurrently
+            user_data, repos = await asyncio.gather(
+                self._fetch_user(session, username),
+                self._fetch_repositories(session, username),
+            )
             if not user_data:
                 raise ValueError(f"GitHub user '{username}' not found")
-            
-            # Fetch repositories
-            repos = await self._fetch_repositories(session, username)
+            self._report_repos(username, repos)
+            self._stop_if_abandoned(username)
             
             # Extract languages and skills
             languages = await self._extract_languages(session, repos)
-            skills = self._analyze_skills(repos, languages)
-            
-            # Calculate statistics
-            stats = self._calculate_stats(user_data, repos, languages)
-            
-            return {
-                'user': {
-                    'username': user_data.get('login'),
-                    'name': user_data.get('name'),
-                    'public_repos': user_data.get('public_repos', 0),
-                    'followers': user_data.get('followers', 0),
-                    'following': user_data.get('following', 0),
-                    'created_at': user_data.get('created_at'),
-                },
-                'languages': languages,
-                'skills': skills,
-                'stats': stats,
-                'repositories': [
-                    {
-                        'name': repo['name'],
-                        'description': repo.get('description'),
-                        'language': repo.get('language'),
-                        'stars': repo.get('stargazers_count', 0),
-                        'forks': repo.get('forks_count', 0),
-                    }
-                    for repo in repos[:10]  # Top 10 repos
-                ]
-            }
+            self._report_languages(username, languages)
+            return self._build_result(user_data, repos, languages)
+    
+    async def _verify_user_incremental(
+        self,
+        session: aiohttp.ClientSession,
+        username: str
+    ) -> Dict[str, Any]:
+        """Fetch and analyze a profile, refreshing the user's stored snapshot.
+        
+        For a known user only the profile and the most recently updated
+        page of repositories are fetched and merged into the snapshot, and
+        languages are refetched only for repositories pushed to since. All
+        repositories are listed when there is no usable snapshot or the
+        merge does not match the change in the user's repository count;
+        stored languages are still reused then.
+        """
+        snapshot = await self.snapshots.get(username)
+        full = snapshot is None
+        if full:
+            user_data, repos = await asyncio.gather(
+                self._fetch_user(session, username),
+                self._fetch_repositories(session, username),
+            )
+        else:
+            user_data, repos = await asyncio.gather(
+                self._fetch_user(session, username),
+                self._refresh_repositories(session, username, snapshot['repos']),
+            )
+            # The repositories the merge adds must account for the change in
+            # the repository count; otherwise some were deleted or renamed
+            added = (user_data or {}).get('public_repos', 0) - (snapshot['user'].get('public_repos') or 0)
+            full = repos is None or len(repos) - len(snapshot['repos']) != added
+            if user_data and full:
+                repos = await self._fetch_repositories(session, username)
+            elif repos is not None:
+                repos = repos[:self.MAX_REPOS]
+        if not user_data:
+            raise ValueError(f"GitHub user '{username}' not found")
+        self.snapshots.stats['full' if full else 'incremental'] += 1
+        
+        repos = [GitHubSnapshotStore.compact_repo(repo) for repo in repos]
+        self._report_repos(username, repos)
+        self._stop_if_abandoned(username)
+        repo_languages = await self._fetch_top_languages(session, repos, snapshot)
+        languages = self._combine_languages(
+            repos,
+            [repo_languages.get(repo['name']) for repo in self._top_repos(repos)]
+        )
+        self._report_languages(username, languages)
+        result = self._build_result(user_data, repos, languages)
+        await self.snapshots.put(username, user_data, repos, repo_languages)
+        return result
+    
+    async def _refresh_repositories(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        known_repos: List[Dict]
+    ) -> Optional[List[Dict]]:
+        """Merge the most recently updated page of repositories into known ones.
+        
+        Repositories are listed by last update, so once the page reaches a
+        repository no newer than the newest known one, every repository
+        changed since the snapshot is on it. A known repository updated
+        after the oldest one on the page must be on it too; if it is not,
+        it was deleted or renamed. Returns None if the page does not reach
+        that far or misses a known repository. The merge is not truncated
+        to MAX_REPOS, so the caller can check it against the user's
+        repository count.
+        """
+        batch, _ = await self._fetch_repo_page(session, username, 1)
+        if not batch:
+            return [] if batch is not None else None
+        if len(batch) < self.REPOS_PER_PAGE:
+            # The page lists every repository
+            return list(batch)
+        
+        oldest_fetched = batch[-1].get('updated_at') or ''
+        newest_known = max((repo.get('updated_at') or '' for repo in known_repos), default='')
+        if oldest_fetched > newest_known:
+            return None
+        
+        fetched = {repo['name'] for repo in batch}
+        if any(
+            repo['name'] not in fetched and (repo.get('updated_at') or '') > oldest_fetched
+            for repo in known_repos
+        ):
+            return None
+        return list(batch) + [repo for repo in known_repos if repo['name'] not in fetched]
+    
+    async def _fetch_top_languages(
+        self,
+        session: aiohttp.ClientSession,
+        repos: List[Dict],
+        snapshot: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Get the language bytes of the top repositories by name.
+        
+        Languages stored in the snapshot are reused for repositories that
+        have not been pushed to since; only the others are fetched.
+        """
+        known_pushes = {}
+        known_languages = {}
+        if snapshot is not None:
+            known_pushes = {repo['name']: repo.get('pushed_at') for repo in snapshot['repos']}
+            known_languages = snapshot['repo_languages']
+        
+        repo_languages = {}
+        stale = []
+        for repo in self._top_repos(repos):
+            name = repo['name']
+            if name in known_languages and known_pushes.get(name) == repo.get('pushed_at'):
+                repo_languages[name] = known_languages[name]
+            else:
+                stale.append(repo)
+        
+        fetched = await self._gather_bounded(
+            self._fetch_repo_languages(session, repo) for repo in stale
+        )
+        for repo, lang_data in zip(stale, fetched):
+            # Missing repositories are left out so the next refresh retries them
+            if lang_data is not None:
+                repo_languages[repo['name']] = lang_data
+        return repo_languages
+    
+    def _build_graphql_result(self, profile: Tuple[Dict, List[Dict], Dict[str, Dict[str, int]]]) -> Dict[str, Any]:
+        """Analyze a profile fetched through the GraphQL backend."""
+        user_data, repos, repo_languages = profile
+        languages = self._combine_languages(
+            repos,
+            [repo_languages.get(repo['name']) for repo in self._top_repos(repos)]
+        )
+        return self._build_result(user_data, repos, languages)
+    
+    def _build_result(self, user_data: Dict, repos: List[Dict], languages: Dict) -> Dict[str, Any]:
+        """Analyze fetched profile data into the verification result."""
+        skills = self._analyze_skills(repos, languages)
+        
+        # Calculate statistics
+        stats = self._calculate_stats(user_data, repos, languages)
+        
+        return {
+            'user': {
+                'username': user_data.get('login'),
+                'name': user_data.get('name'),
+                'public_repos': user_data.get('public_repos', 0),
+                'followers': user_data.get('followers', 0),
+                'following': user_data.get('following', 0),
+                'created_at': user_data.get('created_at'),
+            },
+            'languages': languages,
+            'skills': skills,
+            'stats': stats,
+            'repositories': [
+                {
+                    'name': repo['name'],
+                    'description': repo.get('description'),
+                    'language': repo.get('language'),
+                    'stars': repo.get('stargazers_count', 0),
+                    'forks': repo.get('forks_count', 0),
+                }
+                for repo in repos[:10]  # Top 10 repos
+            ]
+        }
     
     async def _fetch_user(self, session: aiohttp.ClientSession, username: str) -> Optional[Dict]:
         """Fetch GitHub user data."""
         url = f"{self.base_url}/users/{username}"
         try:
-            async with session.get(url, headers=self.headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    return None
-                else:
-                    raise Exception(f"GitHub API error: {response.status}")
+            status, data, _ = await self._get_json(session, url)
+            if status == 200:
+                self._report_profile(username, data)
+                return data
+            elif status == 404:
+                return None
+            else:
+                raise Exception(f"GitHub API error: {status}")
+        except GitHubRateLimitError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to fetch GitHub user: {str(e)}")
     
     async def _fetch_repositories(self, session: aiohttp.ClientSession, username: str) -> List[Dict]:
-        """Fetch user's repositories."""
-        repos = []
-        page = 1
-        per_page = 100
-        
-        while True:
-            url = f"{self.base_url}/users/{username}/repos"
-            params = {
-                'page': page,
-                'per_page': per_page,
-                'sort': 'updated',
-                'direction': 'desc'
-            }
-            
-            try:
-                async with session.get(url, headers=self.headers, params=params) as response:
-                    if response.status == 200:
-                        batch = await response.json()
-                        if not batch:
-                            break
-                        repos.extend(batch)
-                        if len(batch) < per_page:
-                            break
-                        page += 1
-                        # Limit to 300 repos to avoid rate limiting
-                        if len(repos) >= 300:
-                            break
-                    else:
-                        break
-            except Exception as e:
+        """Fetch user's repositories.
+        
+        The first page tells how many pages exist; the rest are fetched
+        concurrently and appended in page order.
+        """
+        batch, link = await self._fetch_repo_page(session, username, 1)
+        if not batch:
+            return []
+        repos = list(batch)
+        if len(batch) < self.REPOS_PER_PAGE:
+            return repos
+        
+        max_pages = self.MAX_REPOS // self.REPOS_PER_PAGE
+        last_page = min(self._parse_last_page(link) or max_pages, max_pages)
+        pages = await self._gather_bounded(
+            self._fetch_repo_page(session, username, page)
+            for page in range(2, last_page + 1)
+        )
+        
+        # Stop at the first missing or short page, as sequential paging would
+        for batch, _ in pages:
+            if not batch:
+                break
+            repos.extend(batch)
+            if len(batch) < self.REPOS_PER_PAGE:
                 break
         
         return repos
     
+    async def _fetch_repo_page(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        page: int
+    ) -> Tuple[Optional[List[Dict]], str]:
+        """Fetch one page of repositories and its Link header.
+        
+        Returns no repositories for a missing user; any other failure raises
+        instead of silently truncating the repository list.
+        """
+        url = f"{self.base_url}/users/{username}/repos"
+        params = {
+            'page': page,
+            'per_page': self.REPOS_PER_PAGE,
+            'sort': 'updated',
+            'direction': 'desc'
+        }
+        
+        status, data, headers = await self._get_json(session, url, params)
+        if status == 200:
+            return data, headers.get('Link', '')
+        elif status == 404:
+            return None, ''
+        else:
+            raise Exception(f"GitHub API error while fetching repositories: {status}")
+    
+    @staticmethod
+    def _parse_last_page(link_header: str) -> Optional[int]:
+        """Get the last page number from a GitHub Link header."""
+        for part in link_header.split(','):
+            if 'rel="last"' in part:
+                match = re.search(r'[?&]page=(\d+)', part)
+                if match:
+                    return int(match.group(1))
+        return None
+    
+    async def _gather_bounded(self, coroutines: Iterable[Awaitable]) -> List[Any]:
+        """Run awaitables concurrently with bounded parallelism, keeping their order."""
+        semaphore = asyncio.Semaphore(settings.GITHUB_FANOUT_CONCURRENCY)
+        
+        async def run(coroutine: Awaitable) -> Any:
+            async with semaphore:
+                return await coroutine
+        
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+    
     async def _extract_languages(self, session: aiohttp.ClientSession, repos: List[Dict]) -> Dict[str, int]:
         """Extract programming languages from repositories."""
+        # For top 10 repos, fetch detailed language stats
+        lang_results = await self._gather_bounded(
+            self._fetch_repo_languages(session, repo) for repo in self._top_repos(repos)
+        )
+        return self._combine_languages(repos, lang_results)
+    
+    @staticmethod
+    def _top_repos(repos: List[Dict]) -> List[Dict]:
+        """Get the 10 repositories with the most stars and forks."""
+        return sorted(
+            repos, 
+            key=lambda x: x.get('stargazers_count', 0) + x.get('forks_count', 0), 
+            reverse=True
+        )[:10]
+    
+    @staticmethod
+    def _combine_languages(repos: List[Dict], lang_results: List[Optional[Dict[str, int]]]) -> Dict[str, int]:
+        """Combine primary languages with the top repos' language breakdowns."""
         languages = {}
         
         # Collect languages from repo primary language
@@ -121,71 +664,74 @@ class GitHubVerifier:
                 lang = repo['language'].lower()
                 languages[lang] = languages.get(lang, 0) + 1
         
-        # For top 10 repos, fetch detailed language stats
-        top_repos = sorted(
-            repos, 
-            key=lambda x: x.get('stargazers_count', 0) + x.get('forks_count', 0), 
-            reverse=True
-        )[:10]
-        
-        for repo in top_repos:
-            url = f"{self.base_url}/repos/{repo['owner']['login']}/{repo['name']}/languages"
-            try:
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        lang_data = await response.json()
-                        for lang, bytes_count in lang_data.items():
-                            lang_lower = lang.lower()
-                            # Weight by bytes of code
-                            weight = min(bytes_count / 10000, 10)  # Cap at 10
-                            languages[lang_lower] = languages.get(lang_lower, 0) + weight
-            except:
+        for lang_data in lang_results:
+            if not lang_data:
                 continue
+            for lang, bytes_count in lang_data.items():
+                lang_lower = lang.lower()
+                # Weight by bytes of code
+                weight = min(bytes_count / 10000, 10)  # Cap at 10
+                languages[lang_lower] = languages.get(lang_lower, 0) + weight
         
         return languages
     
+    async def _fetch_repo_languages(
+        self,
+        session: aiohttp.ClientSession,
+        repo: Dict
+    ) -> Optional[Dict[str, int]]:
+        """Fetch the language breakdown of a repository.
+        
+        Returns None for a missing repository; any other failure raises
+        instead of scoring on partial language data.
+        """
+        url = f"{self.base_url}/repos/{repo['owner']['login']}/{repo['name']}/languages"
+        status, data, _ = await self._get_json(session, url)
+        if status == 200:
+            return data
+        elif status == 404:
+            return None
+        else:
+            raise Exception(f"GitHub API error while fetching languages: {status}")
+    
+    def _build_repo_skill_matcher(self) -> Tuple[SkillMatcher, Dict[str, Tuple[str, ...]]]:
+        """Compile taxonomy skills and keyword patterns into one substring matcher.
+        
+        Returns the matcher and the skills implied by each of its terms.
+        """
+        term_skills: Dict[str, Set[str]] = {skill: {skill} for skill in self.taxonomy.skills}
+        for skill, keywords in self.KEYWORD_PATTERNS.items():
+            for keyword in keywords:
+                term_skills.setdefault(keyword, set()).add(skill)
+        matcher = SkillMatcher(term_skills, word_boundaries=False)
+        return matcher, {term: tuple(skills) for term, skills in term_skills.items()}
+    
     def _analyze_skills(self, repos: List[Dict], languages: Dict[str, int]) -> List[str]:
         """Analyze and extract skills from repositories."""
         skills = set()
+        all_skills = self.taxonomy.skills
         
         # Add programming languages
         for lang in languages.keys():
-            normalized = self.skill_db.normalize_skill(lang)
-            if normalized in self.skill_db.get_all_skills():
+            normalized = self.taxonomy.normalize(lang)
+            if normalized in all_skills:
                 skills.add(normalized)
             # Also add the original language
             skills.add(lang)
         
-        # Analyze repository names and descriptions for frameworks/tools
-        for repo in repos:
-            # Check repo name
-            repo_name = repo.get('name', '').lower()
-            description = (repo.get('description') or '').lower()
-            
-            # Check for known skills in repo name and description
-            for skill in self.skill_db.get_all_skills():
-                if skill in repo_name or skill in description:
-                    skills.add(skill)
-            
-            # Check for specific patterns
-            patterns = {
-                'docker': ['docker', 'containerized', 'dockerfile'],
-                'kubernetes': ['k8s', 'kubernetes', 'kubectl'],
-                'react': ['react', 'jsx', 'next.js', 'nextjs', 'gatsby'],
-                'vue': ['vue', 'nuxt', 'vuex'],
-                'angular': ['angular', 'ng-', 'ngrx'],
-                'django': ['django'],
-                'flask': ['flask'],
-                'fastapi': ['fastapi', 'fast-api'],
-                'spring': ['spring', 'springboot', 'spring-boot'],
-                'aws': ['aws', 'amazon', 's3', 'ec2', 'lambda'],
-                'machine learning': ['ml', 'machine-learning', 'tensorflow', 'pytorch', 'scikit'],
-                'data science': ['data-science', 'pandas', 'numpy', 'jupyter'],
-            }
-            
-            for skill, keywords in patterns.items():
-                if any(kw in repo_name or kw in description for kw in keywords):
-                    skills.add(skill)
+        # Scan repository names, descriptions and topics for frameworks/tools
+        # in one pass; no term spans a line, so fields cannot run together
+        metadata = '\n'.join(
+            field
+            for repo in repos
+            for field in (
+                repo.get('name', ''),
+                repo.get('description') or '',
+                *(repo.get('topics') or []),
+            )
+        ).lower()
+        for term in self.repo_skill_matcher.find_all(metadata):
+            skills.update(self.repo_term_skills[term])
         
         return sorted(list(skills))
     
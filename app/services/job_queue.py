@@ -0,0 +1,399 @@
+"""Durable queue of background verification jobs."""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.models.response import VerificationResponse
+from app.services.github_token_pool import GitHubRateLimitError
+from app.services.verification_pipeline import error_status
+
+
+logger = logging.getLogger(__name__)
+
+# Runs a verification: handler(pdf_bytes, github_username)
+JobHandler = Callable[[bytes, str], Awaitable[VerificationResponse]]
+
+
+class JobQueueFullError(Exception):
+    """Raised when too many jobs are waiting to run."""
+
+
+class JobQueue:
+    """Run verifications in the background from a SQLite-backed queue.
+
+    Submitted resumes are stored with their job so queued work survives a
+    restart. Several processes may share the database: a worker claims a
+    job atomically and holds a lease on it, renewed while the job runs,
+    and jobs whose lease has run out are queued again. A fixed number of
+    workers per process bounds concurrency. Transient failures are retried
+    with a growing delay, up to max_attempts runs. Finished jobs, and
+    their results, expire after result_ttl seconds. Database calls run in
+    a thread so they do not block the event loop.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    PURGE_INTERVAL = 60.0  # seconds
+
+    def __init__(
+        self,
+        path: str,
+        handler: JobHandler,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_delay: float = 5.0,
+        result_ttl: float = 3600.0,
+        max_queued: int = 1000,
+        poll_interval: float = 1.0,
+        lease_time: float = 60.0
+    ):
+        self.path = path
+        self.handler = handler
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.result_ttl = result_ttl
+        self.max_queued = max_queued
+        self.poll_interval = poll_interval
+        self.lease_time = lease_time
+        # Identifies this process's claims in the shared database
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._db: Optional[sqlite3.Connection] = None
+        # One connection is shared by the threads running database calls
+        self._lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._last_purge = 0.0
+
+    async def start(self) -> None:
+        """Open the queue database, requeue abandoned jobs and start workers."""
+        if self._db is not None:
+            return
+        await asyncio.to_thread(self._open)
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker())
+            for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers and queue the jobs they were running again."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._db is not None:
+            await self._call(self._release)
+            self._db.close()
+            self._db = None
+
+    async def submit(self, resume: bytes, github_username: str) -> str:
+        """Queue a verification and return its job id."""
+        job_id = await self._call(self._insert, resume, github_username)
+        self._wakeup.set()
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get the status of a job, with its result or error once finished.
+
+        Returns None for unknown and expired jobs.
+        """
+        row = await self._call(
+            self._fetchone,
+            """
+            SELECT id, status, github_username, attempts, result, error, status_code,
+                   created_at, updated_at, expires_at
+            FROM jobs WHERE id = ?
+            """,
+            (job_id,)
+        )
+        if row is None or (row['expires_at'] is not None and row['expires_at'] <= time.time()):
+            return None
+
+        job = {
+            'job_id': row['id'],
+            'status': row['status'],
+            'github_username': row['github_username'],
+            'attempts': row['attempts'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+        }
+        if row['status'] == self.SUCCEEDED:
+            job['result'] = json.loads(row['result'])
+        elif row['status'] == self.FAILED:
+            job['error'] = row['error']
+            job['status_code'] = row['status_code']
+        return job
+
+    async def get_stats(self) -> Dict[str, int]:
+        """Count jobs by status for monitoring."""
+        if self._db is None:
+            return {}
+        rows = await self._call(
+            self._fetchall,
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status",
+            ()
+        )
+        return {status: count for status, count in rows}
+
+    async def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a database call in a thread, one at a time."""
+        def locked() -> Any:
+            with self._lock:
+                return func(*args)
+        return await asyncio.to_thread(locked)
+
+    def _fetchone(self, sql: str, params: tuple) -> Optional[sqlite3.Row]:
+        return self._db.execute(sql, params).fetchone()
+
+    def _fetchall(self, sql: str, params: tuple) -> List[sqlite3.Row]:
+        return self._db.execute(sql, params).fetchall()
+
+    def _open(self) -> None:
+        """Open and migrate the database and requeue abandoned jobs."""
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                github_username TEXT NOT NULL,
+                resume BLOB,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                status_code INTEGER,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                run_after REAL NOT NULL,
+                expires_at REAL,
+                owner TEXT,
+                lease_until REAL
+            )
+            """
+        )
+        columns = {row['name'] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in (('owner', 'TEXT'), ('lease_until', 'REAL')):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, run_after)"
+        )
+        self._requeue_abandoned()
+
+    def _insert(self, resume: bytes, github_username: str) -> str:
+        """Store a new job, failing if the queue is full."""
+        queued = self._db.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)",
+            (self.QUEUED, self.RUNNING)
+        ).fetchone()[0]
+        if queued >= self.max_queued:
+            raise JobQueueFullError("Verification queue is full")
+
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._db.execute(
+            """
+            INSERT INTO jobs (id, status, github_username, resume, created_at, updated_at, run_after)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (job_id, self.QUEUED, github_username, resume, now, now, now)
+        )
+        return job_id
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Lease the oldest runnable job to this process and return it.
+
+        The write lock is taken before reading, so two processes never
+        claim the same job.
+        """
+        now = time.time()
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._db.execute(
+                """
+                SELECT id, github_username, resume, attempts FROM jobs
+                WHERE status = ? AND run_after <= ?
+                ORDER BY run_after LIMIT 1
+                """,
+                (self.QUEUED, now)
+            ).fetchone()
+            if row is not None:
+                claimed = self._db.execute(
+                    """
+                    UPDATE jobs SET status = ?, owner = ?, lease_until = ?,
+                           attempts = attempts + 1, updated_at = ?
+                    WHERE id = ? AND status = ?
+                    """,
+                    (self.RUNNING, self.owner, now + self.lease_time, now, row['id'], self.QUEUED)
+                ).rowcount
+                if not claimed:
+                    row = None
+        finally:
+            self._db.execute("COMMIT")
+        return row
+
+    def _renew(self, job_id: str) -> bool:
+        """Extend the lease on a running job; False if it was lost."""
+        return self._db.execute(
+            "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND owner = ?",
+            (time.time() + self.lease_time, job_id, self.RUNNING, self.owner)
+        ).rowcount > 0
+
+    def _requeue_abandoned(self) -> None:
+        """Queue again the running jobs whose lease has run out."""
+        now = time.time()
+        requeued = self._db.execute(
+            """
+            UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, updated_at = ?
+            WHERE status = ? AND (lease_until IS NULL OR lease_until < ?)
+            """,
+            (self.QUEUED, now, self.RUNNING, now)
+        ).rowcount
+        if requeued:
+            logger.info(f"Requeued {requeued} abandoned verification jobs")
+
+    def _release(self) -> None:
+        """Queue again the jobs this process was running."""
+        self._db.execute(
+            """
+            UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL, updated_at = ?
+            WHERE status = ? AND owner = ?
+            """,
+            (self.QUEUED, time.time(), self.RUNNING, self.owner)
+        )
+
+    def _next_run_delay(self) -> float:
+        """Get the time until the next delayed job may run."""
+        row = self._db.execute(
+            "SELECT MIN(run_after) FROM jobs WHERE status = ?",
+            (self.QUEUED,)
+        ).fetchone()
+        if row[0] is None:
+            return self.poll_interval
+        return min(max(row[0] - time.time(), 0), self.poll_interval)
+
+    def _maintain(self) -> None:
+        """Delete expired jobs and requeue abandoned ones, once per PURGE_INTERVAL."""
+        now = time.time()
+        if now - self._last_purge < self.PURGE_INTERVAL:
+            return
+        self._last_purge = now
+        self._db.execute(
+            "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (now,)
+        )
+        self._requeue_abandoned()
+
+    async def _worker(self) -> None:
+        """Run queued jobs one at a time."""
+        while True:
+            await self._call(self._maintain)
+            row = await self._call(self._claim)
+            if row is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), await self._call(self._next_run_delay))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                response = await self._run(row)
+            except Exception as e:
+                await self._call(self._fail, row, e)
+            else:
+                if response is not None:
+                    await self._call(self._finish, row['id'], response)
+
+    async def _run(self, row: sqlite3.Row) -> Optional[VerificationResponse]:
+        """Run a claimed job, renewing its lease until it finishes.
+
+        Returns None if the lease was lost and the job given up.
+        """
+        task = asyncio.ensure_future(self.handler(row['resume'], row['github_username']))
+        try:
+            while True:
+                done, _ = await asyncio.wait({task}, timeout=self.lease_time / 3)
+                if done:
+                    return task.result()
+                if not await self._call(self._renew, row['id']):
+                    logger.warning(f"Verification job {row['id']} lost its lease, giving it up")
+                    return None
+        finally:
+            task.cancel()
+
+    def _finish(self, job_id: str, response: VerificationResponse) -> None:
+        """Store the result of a successful job."""
+        now = time.time()
+        self._db.execute(
+            """
+            UPDATE jobs SET status = ?, result = ?, resume = NULL, error = NULL,
+                   status_code = 200, owner = NULL, lease_until = NULL,
+                   updated_at = ?, expires_at = ?
+            WHERE id = ? AND owner = ?
+            """,
+            (
+                self.SUCCEEDED,
+                json.dumps(response.model_dump(mode='json')),
+                now,
+                now + self.result_ttl,
+                job_id,
+                self.owner
+            )
+        )
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether a failure may succeed on retry.
+
+        Rate limits and GitHub or network errors are transient; ValueErrors
+        such as unreadable resumes or unknown users are not.
+        """
+        return isinstance(error, GitHubRateLimitError) or not isinstance(error, ValueError)
+
+    def _fail(self, row: sqlite3.Row, error: Exception) -> None:
+        """Retry a failed job later, or record the failure."""
+        status_code, detail = error_status(error)
+        now = time.time()
+        attempts = row['attempts'] + 1
+        if self._is_retryable(error) and attempts < self.max_attempts:
+            delay = self.retry_delay * 2 ** (attempts - 1)
+            if isinstance(error, GitHubRateLimitError):
+                delay = max(delay, error.retry_after)
+            self._db.execute(
+                """
+                UPDATE jobs SET status = ?, error = ?, status_code = ?, owner = NULL,
+                       lease_until = NULL, updated_at = ?, run_after = ?
+                WHERE id = ? AND owner = ?
+                """,
+                (self.QUEUED, detail, status_code, now, now + delay, row['id'], self.owner)
+            )
+            logger.warning(f"Verification job {row['id']} failed, retrying in {delay:.0f}s: {detail}")
+            return
+
+        self._db.execute(
+            """
+            UPDATE jobs SET status = ?, resume = NULL, error = ?, status_code = ?,
+                   owner = NULL, lease_until = NULL, updated_at = ?, expires_at = ?
+            WHERE id = ? AND owner = ?
+            """,
+            (self.FAILED, detail, status_code, now, now + self.result_ttl, row['id'], self.owner)
+        )
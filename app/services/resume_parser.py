@@ -1,8 +1,11 @@
 """Resume parsing service."""
 
-import re
-from typing import Dict, Any
+from typing import Dict, Any, Union
+from app.config import settings
 from app.utils.file_handler import FileHandler
+from app.utils.pdf_executor import PdfExecutor
+from app.utils.resume_cache import get_resume_cache
+from app.utils.resume_sections import find_section_starts
 
 
 class ResumeParser:
@@ -10,19 +13,49 @@ class ResumeParser:
     
     def __init__(self):
         self.file_handler = FileHandler()
+        self.pdf_executor = PdfExecutor(
+            mode=settings.PDF_EXECUTOR,
+            workers=settings.PDF_WORKERS,
+            timeout=settings.PDF_PARSE_TIMEOUT,
+        )
+        self.cache = get_resume_cache()
     
-    async def parse_pdf(self, pdf_path: str) -> Dict[str, Any]:
-        """Parse PDF resume and extract text."""
-        text = self.file_handler.extract_text_from_pdf(pdf_path)
+    async def parse_pdf(self, source: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse PDF resume, given as a file path or bytes, and extract text.
+        
+        Extraction stops at the configured page and character budgets;
+        'truncated' says whether text was left out. Results for PDF bytes
+        are cached by content hash and extraction budgets, so re-uploads of
+        the same file skip extraction.
+        """
+        cache_key = None
+        if isinstance(source, bytes):
+            budgets = (
+                f"p{settings.PDF_MAX_PAGES}-c{settings.PDF_MAX_CHARS}"
+                f"-t{settings.PDF_PAGE_TIME_BUDGET}"
+            )
+            cache_key = self.cache.make_key('resume', source, budgets)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Extract in the worker pool to keep the event loop responsive
+        content = await self.pdf_executor.run(FileHandler.extract_pdf_content, source)
+        text = content['text']
         
         if not text or len(text) < 100:
             raise ValueError("Insufficient text extracted from resume")
         
-        return {
+        resume_data = {
             'text': text,
             'word_count': len(text.split()),
-            'char_count': len(text)
+            'char_count': len(text),
+            'page_count': content['pages'],
+            'truncated': content['truncated']
         }
+        if cache_key is not None:
+            self.cache.put(cache_key, resume_data)
+        return resume_data
     
     def extract_sections(self, text: str) -> Dict[str, str]:
         """Extract different sections from resume text."""
@@ -34,25 +67,12 @@ class ResumeParser:
         }
         
         # Simple section detection based on keywords
-        section_patterns = {
-            'skills': r'(?i)(skills?|technical skills?|core competenc\w+|expertise)',
-            'experience': r'(?i)(experience|work experience|employment|professional experience)',
-            'education': r'(?i)(education|academic|qualification|degree)',
-            'projects': r'(?i)(projects?|portfolio|work samples)'
-        }
-        
-        lines = text.split('\n')
-        current_section = None
+        section_starts = find_section_starts(text)
         
-        for line in lines:
-            # Check if line matches any section header
-            for section, pattern in section_patterns.items():
-                if re.search(pattern, line):
-                    current_section = section
-                    break
-            
-            # Add line to current section
-            if current_section:
-                sections[current_section] += line + '\n'
+        for index, (start, section) in enumerate(section_starts):
+            if index + 1 < len(section_starts):
+                sections[section] += text[start:section_starts[index + 1][0]]
+            else:
+                sections[section] += text[start:] + '\n'
         
         return sections
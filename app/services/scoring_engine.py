@@ -1,41 +1,89 @@
 """Scoring engine for trust and risk assessment."""
 
-from typing import List, Dict, Tuple
+from typing import List, Dict, Mapping, Optional, Tuple
+import numpy as np
+from numpy.typing import ArrayLike
 from app.models.response import RiskLevel
 
 
+class ScoringConfig:
+    """Weights and thresholds used to compute trust scores and risk levels."""
+    
+    def __init__(
+        self,
+        match_weight: float = 0.5,
+        repos_scale: float = 50,
+        recent_activity_scale: float = 10,
+        stars_scale: float = 100,
+        activity_points: float = 5,
+        popular_repos_points: float = 5,
+        min_account_age_years: float = 1,
+        account_age_scale: float = 5,
+        account_age_points: float = 10,
+        min_language_diversity: int = 3,
+        language_diversity_points: float = 5,
+        skill_depth_tiers: Tuple[Tuple[float, float], ...] = ((0.7, 15), (0.5, 10), (0.3, 5)),
+        low_risk: Tuple[float, float] = (75, 70),
+        medium_risk: Tuple[float, float] = (50, 40),
+        high_risk: Tuple[float, float] = (30, 30)
+    ):
+        self.match_weight = match_weight
+        self.repos_scale = repos_scale
+        self.recent_activity_scale = recent_activity_scale
+        self.stars_scale = stars_scale
+        self.activity_points = activity_points
+        self.popular_repos_points = popular_repos_points
+        self.min_account_age_years = min_account_age_years
+        self.account_age_scale = account_age_scale
+        self.account_age_points = account_age_points
+        self.min_language_diversity = min_language_diversity
+        self.language_diversity_points = language_diversity_points
+        # (GitHub/resume skill ratio, points), checked from the highest ratio
+        self.skill_depth_tiers = skill_depth_tiers
+        # (minimum trust score, minimum match percentage) per risk level;
+        # LOW and MEDIUM need both, HIGH needs either
+        self.low_risk = low_risk
+        self.medium_risk = medium_risk
+        self.high_risk = high_risk
+
+
 class ScoringEngine:
     """Calculate trust scores and risk levels."""
     
+    def __init__(self, config: Optional[ScoringConfig] = None):
+        self.config = config or ScoringConfig()
+    
     def calculate_match_score(
         self,
         resume_skills: List[str],
         github_skills: List[str]
-    ) -> Tuple[List[Dict], float]:
-        """Calculate skill match score."""
+    ) -> Tuple[List[Dict], float, List[str]]:
+        """Calculate skill match score.
+        
+        Returns the match of every resume skill, the match percentage and
+        the resume skills not found on GitHub.
+        """
         matched_skills = []
-        resume_skills_lower = {skill.lower() for skill in resume_skills}
-        github_skills_lower = {skill.lower() for skill in github_skills}
+        unmatched_skills = []
+        # Lowercased GitHub skill -> its spellings, in list order
+        github_spellings: Dict[str, List[str]] = {}
+        for gs in github_skills:
+            github_spellings.setdefault(gs.lower(), []).append(gs)
         
         for skill in resume_skills:
             skill_lower = skill.lower()
-            found = skill_lower in github_skills_lower
+            github_projects = github_spellings.get(skill_lower, [])
+            found = bool(github_projects)
             
             # Check for similar skills
             confidence = 1.0 if found else 0.0
-            github_projects = []
             
-            if found:
-                github_projects = [
-                    gs for gs in github_skills 
-                    if gs.lower() == skill_lower
-                ]
-            else:
-                # Check for partial matches
-                for gs in github_skills_lower:
+            if not found:
+                # Check for partial matches, taking the first in list order
+                for gs in github_spellings:
                     if skill_lower in gs or gs in skill_lower:
                         confidence = 0.5
-                        github_projects.append(gs)
+                        github_projects = [gs]
                         break
             
             matched_skills.append({
@@ -44,18 +92,17 @@ class ScoringEngine:
                 'confidence': confidence,
                 'github_projects': github_projects[:3]  # Top 3 related projects
             })
+            if confidence == 0:
+                unmatched_skills.append(skill)
         
         # Calculate match percentage
         if not resume_skills:
             match_percentage = 0.0
         else:
-            matched_count = sum(
-                1 for m in matched_skills 
-                if m['found_in_github'] or m['confidence'] > 0
-            )
+            matched_count = len(resume_skills) - len(unmatched_skills)
             match_percentage = (matched_count / len(resume_skills)) * 100
         
-        return matched_skills, match_percentage
+        return matched_skills, match_percentage, unmatched_skills
     
     def calculate_trust_score(
         self,
@@ -65,36 +112,36 @@ class ScoringEngine:
         github_skill_count: int
     ) -> float:
         """Calculate overall trust score."""
+        config = self.config
+        
         # Base score from skill match
-        base_score = match_percentage * 0.5  # 50% weight
+        base_score = match_percentage * config.match_weight  # 50% weight
         
         # GitHub activity score (20% weight)
         activity_score = 0
         if github_stats.get('total_repos', 0) > 0:
-            activity_score += min(github_stats['total_repos'] / 50, 1) * 5
+            activity_score += min(github_stats['total_repos'] / config.repos_scale, 1) * config.activity_points
         if github_stats.get('recent_activity', 0) > 0:
-            activity_score += min(github_stats['recent_activity'] / 10, 1) * 5
+            activity_score += min(github_stats['recent_activity'] / config.recent_activity_scale, 1) * config.activity_points
         if github_stats.get('total_stars', 0) > 0:
-            activity_score += min(github_stats['total_stars'] / 100, 1) * 5
+            activity_score += min(github_stats['total_stars'] / config.stars_scale, 1) * config.activity_points
         if github_stats.get('has_popular_repos'):
-            activity_score += 5
+            activity_score += config.popular_repos_points
         
         # Account credibility (15% weight)
         credibility_score = 0
-        if github_stats.get('account_age_years', 0) > 1:
-            credibility_score += min(github_stats['account_age_years'] / 5, 1) * 10
-        if github_stats.get('language_diversity', 0) > 3:
-            credibility_score += 5
+        if github_stats.get('account_age_years', 0) > config.min_account_age_years:
+            credibility_score += min(github_stats['account_age_years'] / config.account_age_scale, 1) * config.account_age_points
+        if github_stats.get('language_diversity', 0) > config.min_language_diversity:
+            credibility_score += config.language_diversity_points
         
         # Skill depth score (15% weight)
         skill_depth_score = 0
         if github_skill_count > 0:
-            if github_skill_count >= resume_skill_count * 0.7:
-                skill_depth_score = 15
-            elif github_skill_count >= resume_skill_count * 0.5:
-                skill_depth_score = 10
-            elif github_skill_count >= resume_skill_count * 0.3:
-                skill_depth_score = 5
+            for ratio, points in config.skill_depth_tiers:
+                if github_skill_count >= resume_skill_count * ratio:
+                    skill_depth_score = points
+                    break
         
         # Final trust score
         trust_score = base_score + activity_score + credibility_score + skill_depth_score
@@ -104,14 +151,111 @@ class ScoringEngine:
     
     def determine_risk_level(self, trust_score: float, match_percentage: float) -> RiskLevel:
         """Determine risk level based on scores."""
-        if trust_score >= 75 and match_percentage >= 70:
+        config = self.config
+        if trust_score >= config.low_risk[0] and match_percentage >= config.low_risk[1]:
             return RiskLevel.LOW
-        elif trust_score >= 50 and match_percentage >= 40:
+        elif trust_score >= config.medium_risk[0] and match_percentage >= config.medium_risk[1]:
             return RiskLevel.MEDIUM
-        elif trust_score >= 30 or match_percentage >= 30:
+        elif trust_score >= config.high_risk[0] or match_percentage >= config.high_risk[1]:
             return RiskLevel.HIGH
         else:
-            return RiskLevel.CRITICAL
+            return RiskLevel.VERY_HIGH
+    
+    def calculate_trust_scores(
+        self,
+        match_percentage: ArrayLike,
+        github_stats: Mapping[str, ArrayLike],
+        resume_skill_count: ArrayLike,
+        github_skill_count: ArrayLike
+    ) -> np.ndarray:
+        """Calculate trust scores for many candidates in one vectorized pass.
+        
+        Takes one array per input of calculate_trust_score, with github_stats
+        given as a mapping of stat name to column; missing stats count as 0.
+        Results are identical to calling calculate_trust_score per candidate.
+        """
+        config = self.config
+        match_percentage = np.asarray(match_percentage, dtype=np.float64)
+        resume_skill_count = np.asarray(resume_skill_count, dtype=np.float64)
+        github_skill_count = np.asarray(github_skill_count, dtype=np.float64)
+        
+        def stat(name: str) -> np.ndarray:
+            column = github_stats.get(name)
+            if column is None:
+                return np.zeros_like(match_percentage)
+            return np.asarray(column, dtype=np.float64)
+        
+        def scaled(values: np.ndarray, threshold: float, scale: float, points: float) -> np.ndarray:
+            return np.where(values > threshold, np.minimum(values / scale, 1) * points, 0.0)
+        
+        # Base score from skill match
+        base_score = match_percentage * config.match_weight
+        
+        # GitHub activity score, summed in the same order as the scalar path
+        activity_score = scaled(stat('total_repos'), 0, config.repos_scale, config.activity_points)
+        activity_score = activity_score + scaled(
+            stat('recent_activity'), 0, config.recent_activity_scale, config.activity_points
+        )
+        activity_score = activity_score + scaled(
+            stat('total_stars'), 0, config.stars_scale, config.activity_points
+        )
+        activity_score = activity_score + np.where(
+            stat('has_popular_repos') != 0, config.popular_repos_points, 0.0
+        )
+        
+        # Account credibility
+        credibility_score = scaled(
+            stat('account_age_years'),
+            config.min_account_age_years,
+            config.account_age_scale,
+            config.account_age_points
+        )
+        credibility_score = credibility_score + np.where(
+            stat('language_diversity') > config.min_language_diversity,
+            config.language_diversity_points,
+            0.0
+        )
+        
+        # Skill depth score
+        skill_depth_score = np.select(
+            [
+                (github_skill_count > 0) & (github_skill_count >= resume_skill_count * ratio)
+                for ratio, _ in config.skill_depth_tiers
+            ],
+            [points for _, points in config.skill_depth_tiers],
+            default=0.0
+        )
+        
+        trust_score = base_score + activity_score + credibility_score + skill_depth_score
+        return np.clip(trust_score, 0, 100)
+    
+    def determine_risk_levels(
+        self,
+        trust_scores: ArrayLike,
+        match_percentage: ArrayLike
+    ) -> np.ndarray:
+        """Determine risk levels for many candidates in one vectorized pass.
+        
+        Returns an array of RiskLevel values, identical to calling
+        determine_risk_level per candidate.
+        """
+        config = self.config
+        trust_scores = np.asarray(trust_scores, dtype=np.float64)
+        match_percentage = np.asarray(match_percentage, dtype=np.float64)
+        
+        levels = np.select(
+            [
+                (trust_scores >= config.low_risk[0]) & (match_percentage >= config.low_risk[1]),
+                (trust_scores >= config.medium_risk[0]) & (match_percentage >= config.medium_risk[1]),
+                (trust_scores >= config.high_risk[0]) | (match_percentage >= config.high_risk[1]),
+            ],
+            [0, 1, 2],
+            default=3
+        )
+        return np.array(
+            [RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH],
+            dtype=object
+        )[levels]
     
     def generate_recommendations(
         self,
@@ -1,31 +1,96 @@
 """Skill extraction service using NLP and keyword matching."""
 
 import re
-from typing import List, Set
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Set
 from collections import Counter
-from app.utils.skill_database import SkillDatabase
+from app.utils.resume_cache import get_resume_cache
+from app.utils.resume_sections import find_section_starts
+from app.utils.skill_database import get_skill_taxonomy
 
 
 class SkillExtractor:
     """Extract skills from resume text."""
     
     def __init__(self):
-        self.skill_db = SkillDatabase()
+        self.taxonomy = get_skill_taxonomy()
+        self.cache = get_resume_cache()
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from text using keyword matching and NLP."""
+        return list(self.extract_skill_occurrences(text))
+    
+    def extract_skill_occurrences(self, text: str) -> Dict[str, Dict[str, Any]]:
+        """Extract skills with their frequency, offsets and sections in one scan.
+        
+        Returns a dict keyed by skill in sorted order. Each entry holds the
+        number of whole-word occurrences, their [start, end] character offsets
+        and the resume sections they appear in. Skills found only through
+        phrase patterns or file extensions have a frequency of 0.
+        
+        Results are cached by a hash of the text and the taxonomy version.
+        """
+        cache_key = self.cache.make_key(
+            'skills',
+            text.encode('utf-8', 'surrogatepass'),
+            self.taxonomy.version[:16]
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         text_lower = text.lower()
+        
+        # Method 1: Direct keyword matching in a single pass
+        occurrences = self._scan_occurrences(text_lower)
+        found_skills = set(occurrences)
+        found_skills.update(self._extract_pattern_skills(text, text_lower))
+        
+        result = {
+            skill: occurrences.get(skill) or self._empty_occurrence()
+            for skill in sorted(found_skills)
+        }
+        self.cache.put(cache_key, result)
+        return result
+    
+    @staticmethod
+    def _empty_occurrence() -> Dict[str, Any]:
+        """Create an occurrence entry for a skill with no direct matches."""
+        return {'frequency': 0, 'positions': [], 'sections': []}
+    
+    def _scan_occurrences(self, text_lower: str) -> Dict[str, Dict[str, Any]]:
+        """Collect positions and sections of every taxonomy skill in the text."""
+        section_starts = find_section_starts(text_lower)
+        section_offsets = [start for start, _ in section_starts]
+        occurrences = {}
+        last_end = {}
+        
+        for start, end, skill in self.taxonomy.matcher.finditer(text_lower):
+            # Count non-overlapping occurrences, like re.findall would
+            if start < last_end.get(skill, 0):
+                continue
+            last_end[skill] = end
+            
+            entry = occurrences.get(skill)
+            if entry is None:
+                entry = occurrences[skill] = self._empty_occurrence()
+            entry['frequency'] += 1
+            entry['positions'].append([start, end])
+            
+            index = bisect_right(section_offsets, start) - 1
+            if index >= 0:
+                section = section_starts[index][1]
+                if section not in entry['sections']:
+                    entry['sections'].append(section)
+        
+        return occurrences
+    
+    def _extract_pattern_skills(self, text: str, text_lower: str) -> Set[str]:
+        """Extract skills from skill phrases and file extensions."""
         found_skills = set()
         
         # Get all known skills
-        all_skills = self.skill_db.get_all_skills()
-        
-        # Method 1: Direct keyword matching
-        for skill in all_skills:
-            # Create word boundary pattern for accurate matching
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill)
+        all_skills = self.taxonomy.skills
         
         # Method 2: Extract from common skill patterns
         skill_patterns = [
@@ -45,7 +110,7 @@ class SkillExtractor:
                 for ps in potential_skills:
                     ps = ps.strip().lower()
                     # Check if it's a known skill
-                    normalized = self.skill_db.normalize_skill(ps)
+                    normalized = self.taxonomy.normalize(ps)
                     if normalized in all_skills:
                         found_skills.add(normalized)
         
@@ -71,17 +136,31 @@ class SkillExtractor:
             if ext in text_lower:
                 found_skills.add(lang)
         
-        # Remove duplicates and return sorted list
-        return sorted(list(found_skills))
+        return found_skills
     
-    def rank_skills(self, skills: List[str], text: str) -> List[tuple]:
-        """Rank skills by frequency in text."""
+    def rank_skills(
+        self,
+        skills: List[str],
+        text: str,
+        occurrences: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> List[tuple]:
+        """Rank skills by frequency in text.
+        
+        Pass the result of extract_skill_occurrences to avoid rescanning.
+        """
         text_lower = text.lower()
+        if occurrences is None:
+            occurrences = self._scan_occurrences(text_lower)
         skill_counts = []
         
         for skill in skills:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            count = len(re.findall(pattern, text_lower))
+            if skill in occurrences:
+                count = occurrences[skill]['frequency']
+            elif skill in self.taxonomy.skills:
+                count = 0
+            else:
+                pattern = r'\b' + re.escape(skill) + r'\b'
+                count = len(re.findall(pattern, text_lower))
             skill_counts.append((skill, count))
         
         # Sort by frequency
@@ -0,0 +1,322 @@
+"""End-to-end resume verification pipeline."""
+
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple, Union
+
+from app.models.response import VerificationResponse
+from app.services.github_token_pool import GitHubRateLimitError
+from app.services.github_verifier import GitHubVerifier, ProgressCallback
+from app.services.resume_parser import ResumeParser
+from app.services.scoring_engine import ScoringEngine
+from app.services.skill_extractor import SkillExtractor
+from app.utils.file_handler import FileHandler, FileTooLargeError
+from app.utils.metrics import STAGE_DURATION
+
+
+class NoSkillsFoundError(ValueError):
+    """Raised when no technical skills are found in a resume."""
+
+
+class NotAPdfError(ValueError):
+    """Raised when an uploaded resume does not start like a PDF."""
+
+
+def error_status(error: Exception) -> Tuple[int, str]:
+    """Map a verification failure to an HTTP status code and detail."""
+    if isinstance(error, (FileTooLargeError, NoSkillsFoundError, NotAPdfError)):
+        return 400, str(error)
+    if isinstance(error, GitHubRateLimitError):
+        return 503, str(error)
+    return 500, f"Verification failed: {str(error)}"
+
+
+class VerificationPipeline:
+    """Parse a resume, extract skills, verify them on GitHub and score them."""
+
+    def __init__(
+        self,
+        resume_parser: ResumeParser,
+        skill_extractor: SkillExtractor,
+        github_verifier: GitHubVerifier,
+        scoring_engine: ScoringEngine,
+        parse_concurrency: int = 4,
+        github_concurrency: int = 8
+    ):
+        self.resume_parser = resume_parser
+        self.skill_extractor = skill_extractor
+        self.github_verifier = github_verifier
+        self.scoring_engine = scoring_engine
+        self.parse_concurrency = parse_concurrency
+        self.github_concurrency = github_concurrency
+
+    async def parse_resume(self, pdf_bytes: bytes) -> Dict[str, Any]:
+        """Parse resume PDF bytes."""
+        with STAGE_DURATION.time('pdf_parse'):
+            return await self.resume_parser.parse_pdf(pdf_bytes)
+
+    def extract_skills(self, resume_data: Dict[str, Any]) -> List[str]:
+        """Extract skills from parsed resume data, failing if there are none."""
+        with STAGE_DURATION.time('skill_extraction'):
+            resume_skills = self.skill_extractor.extract_skills(resume_data['text'])
+        if not resume_skills:
+            raise NoSkillsFoundError("No technical skills found in resume")
+        return resume_skills
+
+    async def fetch_github(
+        self,
+        github_username: str,
+        progress: Optional[ProgressCallback] = None
+    ) -> Dict[str, Any]:
+        """Fetch and analyze a GitHub profile."""
+        with STAGE_DURATION.time('github'):
+            return await self.github_verifier.verify_user(github_username, progress)
+
+    def build_response(
+        self,
+        resume_data: Dict[str, Any],
+        resume_skills: List[str],
+        github_data: Dict[str, Any]
+    ) -> VerificationResponse:
+        """Score resume skills against a GitHub profile."""
+        with STAGE_DURATION.time('scoring'):
+            return self._build_response(resume_data, resume_skills, github_data)
+
+    def _build_response(
+        self,
+        resume_data: Dict[str, Any],
+        resume_skills: List[str],
+        github_data: Dict[str, Any]
+    ) -> VerificationResponse:
+        github_skills = github_data['skills']
+
+        # Calculate match score
+        matched_skills, match_percentage, unmatched_skills = self.scoring_engine.calculate_match_score(
+            resume_skills,
+            github_skills
+        )
+
+        # Calculate trust score
+        trust_score = self.scoring_engine.calculate_trust_score(
+            match_percentage,
+            github_data['stats'],
+            len(resume_skills),
+            len(github_skills)
+        )
+
+        # Determine risk level
+        risk_level = self.scoring_engine.determine_risk_level(trust_score, match_percentage)
+
+        # Generate recommendations
+        recommendations = self.scoring_engine.generate_recommendations(
+            trust_score,
+            match_percentage,
+            github_data['stats'],
+            unmatched_skills
+        )
+
+        return VerificationResponse(
+            timestamp=datetime.utcnow().isoformat(),
+            resume_skills=resume_skills,
+            github_skills=github_skills,
+            matched_skills=matched_skills,
+            total_resume_skills=len(resume_skills),
+            total_github_skills=len(github_skills),
+            matched_count=len(matched_skills),
+            match_percentage=match_percentage,
+            trust_score=trust_score,
+            risk_level=risk_level,
+            recommendations=recommendations,
+            github_stats=github_data['stats'],
+            resume_truncated=resume_data['truncated']
+        )
+
+    async def read_resume(
+        self,
+        pdf_bytes: Union[bytes, Awaitable[bytes]],
+        progress: Optional[ProgressCallback] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Parse a resume and extract its skills.
+
+        pdf_bytes may be an awaitable, such as an upload still being read.
+        progress gets a resume_skills event once the skills are known.
+        """
+        if not isinstance(pdf_bytes, bytes):
+            pdf_bytes = await pdf_bytes
+        resume_data = await self.parse_resume(pdf_bytes)
+        resume_skills = self.extract_skills(resume_data)
+        if progress is not None:
+            progress('resume_skills', {
+                'skills': resume_skills,
+                'count': len(resume_skills),
+                'truncated': resume_data['truncated'],
+            })
+        return resume_data, resume_skills
+
+    async def verify(
+        self,
+        pdf_bytes: Union[bytes, Awaitable[bytes]],
+        github_username: str,
+        progress: Optional[ProgressCallback] = None
+    ) -> VerificationResponse:
+        """Run the whole pipeline for one resume and GitHub username.
+
+        The upload is read and checked for a PDF header first, so files
+        that are not PDFs never reach GitHub. The GitHub profile is then
+        fetched while the resume is parsed and searched for skills, and
+        the two join for scoring. If either fails its error is raised at
+        once and the other is cancelled, preferring the resume error when
+        both have failed. The GitHub fetch is shared through
+        GitHubVerifier: once no caller waits for it, it stops before its
+        next stage, but the requests already in flight still complete.
+
+        progress, if given, is called with an event name and data as each
+        stage finishes; see GitHubVerifier.verify_user for the GitHub ones.
+        """
+        if not isinstance(pdf_bytes, bytes):
+            pdf_bytes = await pdf_bytes
+        if not FileHandler.validate_pdf_header(pdf_bytes):
+            raise NotAPdfError("Uploaded file is not a PDF")
+
+        github_task = asyncio.ensure_future(self.fetch_github(github_username, progress))
+        resume_task = asyncio.ensure_future(self.read_resume(pdf_bytes, progress))
+        tasks = (resume_task, github_task)
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            errors = [
+                task.exception() for task in tasks
+                if task.done() and task.exception() is not None
+            ]
+            if errors:
+                raise errors[0]
+            resume_data, resume_skills = resume_task.result()
+            github_data = github_task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self.build_response(resume_data, resume_skills, github_data)
+
+    async def verify_events(
+        self,
+        pdf_bytes: Union[bytes, Awaitable[bytes]],
+        github_username: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Run verify, yielding (event, data) pairs as its stages finish.
+
+        The last pair is ('result', the VerificationResponse as JSON data)
+        or ('error', a status and detail as verify_many reports them). The
+        pipeline is cancelled if the consumer stops early.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self.verify(pdf_bytes, github_username, lambda event, data: events.put_nowait((event, data)))
+        )
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while True:
+                item = await events.get()
+                if item is None:
+                    break
+                yield item
+
+            try:
+                response = task.result()
+            except Exception as e:
+                status, detail = error_status(e)
+                error = {'status': status, 'error': detail}
+                if isinstance(e, GitHubRateLimitError):
+                    error['retry_after'] = int(e.retry_after) + 1
+                yield 'error', error
+                return
+            yield 'result', response.model_dump(mode='json')
+        finally:
+            task.cancel()
+
+    async def verify_many(self, items: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Verify a batch of resumes, yielding each result as soon as it is ready.
+
+        Items hold a filename, a github_username and either the PDF content
+        or an error. Parsing and GitHub lookups run with separate concurrency
+        limits, and items with the same username share one GitHub lookup.
+        When the GitHub backend batches users, every profile is looked up
+        up front in groups of its batch size. Results carry the item index
+        and an HTTP-style status; remaining work is cancelled if the
+        consumer stops early.
+        """
+        parse_semaphore = asyncio.Semaphore(self.parse_concurrency)
+        github_semaphore = asyncio.Semaphore(self.github_concurrency)
+        github_tasks: Dict[str, asyncio.Task] = {}
+        batch_tasks: List[asyncio.Task] = []
+
+        async def fetch_profile(username: str) -> Dict[str, Any]:
+            async with github_semaphore:
+                return await self.fetch_github(username)
+
+        async def fetch_batch(usernames: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+            async with github_semaphore:
+                with STAGE_DURATION.time('github'):
+                    return await self.github_verifier.verify_users(usernames)
+
+        async def batch_profile(batch: asyncio.Task, username: str) -> Dict[str, Any]:
+            profile = (await asyncio.shield(batch))[username]
+            if profile is None:
+                raise ValueError(f"GitHub user '{username}' not found")
+            return profile
+
+        batch_size = self.github_verifier.batch_size
+        if batch_size > 1:
+            spellings: Dict[str, str] = {}
+            for item in items:
+                if not item.get('error'):
+                    spellings.setdefault(item['github_username'].lower(), item['github_username'])
+            usernames = list(spellings.values())
+            for start in range(0, len(usernames), batch_size):
+                group = usernames[start:start + batch_size]
+                batch = asyncio.ensure_future(fetch_batch(group))
+                batch_tasks.append(batch)
+                for username in group:
+                    github_tasks[username.lower()] = asyncio.ensure_future(batch_profile(batch, username))
+
+        def github_lookup(username: str) -> asyncio.Task:
+            key = username.lower()
+            if key not in github_tasks:
+                github_tasks[key] = asyncio.ensure_future(fetch_profile(username))
+            return github_tasks[key]
+
+        async def verify_item(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+            result = {
+                'index': index,
+                'filename': item['filename'],
+                'github_username': item['github_username'],
+            }
+            if item.get('error'):
+                result.update({'status': 400, 'error': item['error']})
+                return result
+
+            try:
+                async with parse_semaphore:
+                    resume_data = await self.parse_resume(item['content'])
+                resume_skills = self.extract_skills(resume_data)
+                # Shielded so one consumer's cancellation does not cancel the shared lookup
+                github_data = await asyncio.shield(github_lookup(item['github_username']))
+                response = self.build_response(resume_data, resume_skills, github_data)
+            except Exception as e:
+                status, detail = error_status(e)
+                result.update({'status': status, 'error': detail})
+                if isinstance(e, GitHubRateLimitError):
+                    result['retry_after'] = int(e.retry_after) + 1
+                return result
+
+            result.update({'status': 200, 'result': response.model_dump(mode='json')})
+            return result
+
+        tasks = [
+            asyncio.ensure_future(verify_item(index, item))
+            for index, item in enumerate(items)
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks + list(github_tasks.values()) + batch_tasks:
+                task.cancel()
@@ -1,9 +1,13 @@
 """File handling utilities."""
 
+import io
+import json
 import os
+import time
 import uuid
 import tempfile
-from typing import Optional
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Union
 from pathlib import Path
 import aiofiles
 from fastapi import UploadFile
@@ -12,9 +16,115 @@ import pdfplumber
 from app.config import settings
 
 
+UPLOAD_CHUNK_SIZE = 64 * 1024  # 64KB
+PDF_HEADER = b"%PDF-"
+BATCH_MANIFEST_NAME = "manifest.json"
+BATCH_MANIFEST_MAX_SIZE = 1024 * 1024  # 1MB
+
+
+class FileTooLargeError(ValueError):
+    """Raised when an upload exceeds the maximum file size."""
+
+
+class PdfPageStream:
+    """Iterate over the text of a PDF page by page within extraction budgets.
+    
+    Iteration stops once max_pages pages or max_chars characters have been
+    read, or after a page that took longer than page_time_budget seconds;
+    stop_reason then says which budget ran out. A file path is treated as
+    a temporary upload and removed when iteration ends.
+    """
+    
+    def __init__(
+        self,
+        source: Union[str, bytes],
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        page_time_budget: Optional[float] = None
+    ):
+        self.source = source
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.page_time_budget = page_time_budget
+        self.pages_read = 0
+        self.chars_read = 0
+        self.stop_reason: Optional[str] = None
+    
+    @property
+    def truncated(self) -> bool:
+        """Whether a budget stopped extraction before the end of the document."""
+        return self.stop_reason is not None
+    
+    def __iter__(self) -> Iterator[str]:
+        pdf_path = self.source if isinstance(self.source, str) else None
+        try:
+            with pdfplumber.open(pdf_path or io.BytesIO(self.source)) as pdf:
+                page_count = len(pdf.pages)
+                for index, page in enumerate(pdf.pages):
+                    if self.max_pages is not None and index >= self.max_pages:
+                        self.stop_reason = 'max_pages'
+                        break
+                    
+                    started = time.monotonic()
+                    page_text = page.extract_text()
+                    elapsed = time.monotonic() - started
+                    self.pages_read += 1
+                    
+                    if page_text:
+                        if self.max_chars is not None and self.chars_read + len(page_text) > self.max_chars:
+                            page_text = page_text[:self.max_chars - self.chars_read]
+                            self.stop_reason = 'max_chars'
+                        self.chars_read += len(page_text)
+                        yield page_text
+                        if self.stop_reason:
+                            break
+                    
+                    if (
+                        self.page_time_budget is not None
+                        and elapsed > self.page_time_budget
+                        and index + 1 < page_count
+                    ):
+                        self.stop_reason = 'page_time_budget'
+                        break
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+        finally:
+            # Clean up temporary file
+            if pdf_path and os.path.exists(pdf_path):
+                os.remove(pdf_path)
+
+
 class FileHandler:
     """Handle file uploads and processing."""
     
+    @staticmethod
+    async def read_upload_file(
+        upload_file: UploadFile,
+        max_size: Optional[int] = None
+    ) -> bytes:
+        """Read an uploaded file into memory in chunks.
+        
+        Bytes are counted as they are read and the upload is rejected as
+        soon as it goes over the limit, without trusting the declared size.
+        """
+        max_size = settings.MAX_FILE_SIZE if max_size is None else max_size
+        error = f"File size exceeds {max_size / 1024 / 1024}MB limit"
+        if upload_file.size is not None and upload_file.size > max_size:
+            raise FileTooLargeError(error)
+        
+        chunks = []
+        total = 0
+        while True:
+            chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > max_size:
+                raise FileTooLargeError(error)
+            chunks.append(chunk)
+        
+        return b"".join(chunks)
+    
     @staticmethod
     async def save_upload_file(upload_file: UploadFile) -> str:
         """Save uploaded file to temporary location."""
@@ -36,23 +146,105 @@ class FileHandler:
         return temp_file_path
     
     @staticmethod
-    def extract_text_from_pdf(pdf_path: str) -> str:
-        """Extract text from PDF file."""
-        text = ""
+    def read_batch_archive(archive: bytes) -> List[Dict[str, Any]]:
+        """Read (resume, GitHub username) pairs from a zip archive.
+        
+        A manifest.json listing {"resume": ..., "github_username": ...}
+        objects names the pairs; without one, every PDF in the archive is
+        paired with the username in its file name. Each pair holds the
+        resume content, or an error if the resume is missing, not a PDF or
+        too large. A resume listed more than once is read once and shared.
+        
+        Raises ValueError for an unreadable archive or manifest, and,
+        before decompressing any resume, for more than BATCH_MAX_ITEMS
+        pairs or more than BATCH_MAX_UNCOMPRESSED_SIZE of resumes.
+        Decompression is blocking; call this off the event loop.
+        """
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
-        finally:
-            # Clean up temporary file
-            if os.path.exists(pdf_path):
-                os.remove(pdf_path)
+            with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+                members = {
+                    info.filename: info for info in zf.infolist()
+                    if not info.is_dir()
+                }
+                if BATCH_MANIFEST_NAME in members:
+                    if members[BATCH_MANIFEST_NAME].file_size > BATCH_MANIFEST_MAX_SIZE:
+                        raise ValueError("Invalid batch archive: manifest.json is too large")
+                    manifest = json.loads(zf.read(BATCH_MANIFEST_NAME))
+                    entries = [
+                        (str(entry['resume']), str(entry['github_username']))
+                        for entry in manifest
+                    ]
+                else:
+                    entries = [
+                        (name, Path(name).stem) for name in sorted(members)
+                        if FileHandler.validate_file_extension(name)
+                    ]
+                
+                if len(entries) > settings.BATCH_MAX_ITEMS:
+                    raise ValueError(f"Batch exceeds {settings.BATCH_MAX_ITEMS} items")
+                readable = {
+                    name for name, _ in entries
+                    if name in members
+                    and FileHandler.validate_file_extension(name)
+                    and FileHandler.validate_file_size(members[name].file_size)
+                }
+                if sum(members[name].file_size for name in readable) > settings.BATCH_MAX_UNCOMPRESSED_SIZE:
+                    raise ValueError(
+                        f"Batch resumes exceed {settings.BATCH_MAX_UNCOMPRESSED_SIZE / 1024 / 1024}MB uncompressed"
+                    )
+                
+                contents: Dict[str, bytes] = {}
+                items = []
+                for name, username in entries:
+                    item = {'filename': name, 'github_username': username}
+                    info = members.get(name)
+                    if info is None:
+                        item['error'] = f"File not found in archive: {name}"
+                    elif not FileHandler.validate_file_extension(name):
+                        item['error'] = "Only PDF files are allowed"
+                    elif not FileHandler.validate_file_size(info.file_size):
+                        item['error'] = f"File size exceeds {settings.MAX_FILE_SIZE / 1024 / 1024}MB limit"
+                    else:
+                        if name not in contents:
+                            contents[name] = zf.read(info)
+                        item['content'] = contents[name]
+                    items.append(item)
+                return items
+        except (zipfile.BadZipFile, json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid batch archive: {str(e)}")
+    
+    @staticmethod
+    def stream_pdf_pages(source: Union[str, bytes]) -> PdfPageStream:
+        """Stream page texts of a PDF within the configured budgets."""
+        return PdfPageStream(
+            source,
+            max_pages=settings.PDF_MAX_PAGES,
+            max_chars=settings.PDF_MAX_CHARS,
+            page_time_budget=settings.PDF_PAGE_TIME_BUDGET,
+        )
+    
+    @staticmethod
+    def extract_pdf_content(source: Union[str, bytes]) -> Dict[str, Any]:
+        """Extract text from a PDF within the configured budgets.
         
-        return text.strip()
+        Returns the text, the number of pages read and whether it was
+        truncated.
+        """
+        stream = FileHandler.stream_pdf_pages(source)
+        text = "".join(page_text + "\n" for page_text in stream).strip()
+        return {
+            'text': text,
+            'pages': stream.pages_read,
+            'truncated': stream.truncated,
+        }
+    
+    @staticmethod
+    def extract_text_from_pdf(source: Union[str, bytes]) -> str:
+        """Extract text from a PDF file path or in-memory PDF bytes.
+        
+        A file path is treated as a temporary upload and removed afterwards.
+        """
+        return FileHandler.extract_pdf_content(source)['text']
     
     @staticmethod
     def validate_file_size(file_size: int) -> bool:
@@ -60,7 +252,14 @@ class FileHandler:
         return file_size <= settings.MAX_FILE_SIZE
     
     @staticmethod
-    def validate_file_extension(filename: str) -> bool:
-        """Validate file extension."""
+    def validate_pdf_header(data: bytes) -> bool:
+        """Check for the PDF header, which may follow up to 1KB of junk."""
+        return PDF_HEADER in data[:1024]
+    
+    @staticmethod
+    def validate_file_extension(filename: Optional[str]) -> bool:
+        """Validate file extension; uploads without a filename fail."""
+        if not filename:
+            return False
         file_extension = Path(filename).suffix.lower()
         return file_extension in settings.ALLOWED_EXTENSIONS
@@ -0,0 +1,279 @@
+"""In-process metrics exported in the Prometheus text format."""
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """Format a label set as {name="value",...}."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """A named metric family with optional labels."""
+
+    TYPE = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        """Render the metric family as text format lines."""
+        return [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.TYPE}',
+            *self._samples(),
+        ]
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """A monotonically increasing value per label set."""
+
+    TYPE = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increase the value for a label set."""
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def set(self, value: float, *labelvalues: str) -> None:
+        """Set the value, for totals counted elsewhere and collected at scrape time."""
+        self._values[labelvalues] = value
+
+    def _samples(self) -> Iterable[str]:
+        for labelvalues, value in self._values.items():
+            yield f'{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}'
+
+
+class Gauge(Counter):
+    """A value per label set that can go up and down."""
+
+    TYPE = 'gauge'
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        """Decrease the value for a label set."""
+        self.inc(*labelvalues, amount=-amount)
+
+
+class _Timer:
+    """Context manager that observes its elapsed time in a histogram."""
+
+    __slots__ = ('histogram', 'labelvalues', 'started')
+
+    def __init__(self, histogram: 'Histogram', labelvalues: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self) -> '_Timer':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, *self.labelvalues)
+
+
+class Histogram(Metric):
+    """Counts of observed values in cumulative buckets per label set."""
+
+    TYPE = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Label set -> [per-bucket counts (last is +Inf), sum]
+        self._values: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record one observation for a label set."""
+        entry = self._values.get(labelvalues)
+        if entry is None:
+            entry = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def time(self, *labelvalues: str) -> _Timer:
+        """Time a block of code: with histogram.time('stage'): ..."""
+        return _Timer(self, labelvalues)
+
+    def _samples(self) -> Iterable[str]:
+        for labelvalues, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+                yield f'{self.name}_bucket{labels} {cumulative}'
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f'{self.name}_sum{labels} {_format_value(total)}'
+            yield f'{self.name}_count{labels} {cumulative}'
+
+
+class MetricsRegistry:
+    """Metrics to export, plus collectors that build metrics at scrape time."""
+
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Add a metric to the export."""
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Add a function returning metrics to read on every scrape."""
+        self._collectors.append(collector)
+
+    def render(self, extra: Iterable[Metric] = ()) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        extra holds metrics read by the caller, for state that has to be
+        awaited and so cannot come from a collector.
+        """
+        metrics = list(self._metrics)
+        for collector in self._collectors:
+            metrics.extend(collector())
+        metrics.extend(extra)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting HTTP responses and requests in flight.
+
+    Requests are labelled with their route template rather than the raw
+    path, so path parameters do not create new series.
+    """
+
+    def __init__(self, app: ASGIApp, requests: Counter, in_flight: Gauge, duration: Histogram):
+        self.app = app
+        self.requests = requests
+        self.in_flight = in_flight
+        self.duration = duration
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        self.in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight.dec()
+            route = self._route_path(scope)
+            self.duration.observe(time.perf_counter() - started, scope['method'], route)
+            self.requests.inc(scope['method'], route, str(status))
+
+    @staticmethod
+    def _route_path(scope: Scope) -> str:
+        """Get the template of the route that handled a request."""
+        app = scope.get('app')
+        for route in getattr(getattr(app, 'router', None), 'routes', ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return 'unmatched'
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(Counter(
+    'trusthire_http_requests_total',
+    'HTTP responses by method, route and status code.',
+    ('method', 'route', 'status'),
+))
+HTTP_REQUESTS_IN_FLIGHT = registry.register(Gauge(
+    'trusthire_http_requests_in_flight',
+    'HTTP requests currently being served.',
+))
+HTTP_REQUEST_DURATION = registry.register(Histogram(
+    'trusthire_http_request_duration_seconds',
+    'HTTP request latency by method and route.',
+    ('method', 'route'),
+))
+STAGE_DURATION = registry.register(Histogram(
+    'trusthire_stage_duration_seconds',
+    'Latency of each verification pipeline stage.',
+    ('stage',),
+))
+GITHUB_REQUEST_DURATION = registry.register(Histogram(
+    'trusthire_github_request_duration_seconds',
+    'Latency of GitHub API requests by endpoint class, including retries.',
+    ('endpoint',),
+))
+GITHUB_REQUESTS = registry.register(Counter(
+    'trusthire_github_requests_total',
+    'GitHub API responses by endpoint class and status code.',
+    ('endpoint', 'status'),
+))
+
+
+def stats_metrics(
+    name: str,
+    documentation: str,
+    stats: Dict[str, Any],
+    counters: Sequence[str],
+    gauges: Optional[Dict[str, str]] = None
+) -> List[Metric]:
+    """Build metrics from a get_stats() dict.
+
+    The keys in counters become an {name}_events_total counter labelled
+    by event; gauges maps further keys to the suffix of a gauge of their
+    own.
+    """
+    events = Counter(f'{name}_events_total', documentation, ('event',))
+    for key in counters:
+        events.set(stats.get(key, 0), key)
+    metrics: List[Metric] = [events]
+    for key, suffix in (gauges or {}).items():
+        gauge = Gauge(f'{name}_{suffix}', f'{documentation} Current {key}.')
+        gauge.set(stats.get(key, 0))
+        metrics.append(gauge)
+    return metrics
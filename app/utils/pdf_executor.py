@@ -0,0 +1,58 @@
+"""Off-loop execution of PDF text extraction."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class PdfExecutor:
+    """Run CPU-bound PDF extraction in a bounded process or thread pool.
+
+    Keeps pdfplumber off the event loop so one large resume does not stall
+    other requests. Jobs beyond the pool size wait in the executor queue;
+    a job cancelled while queued (timeout or client disconnect) never runs.
+    A job already running in a worker cannot be interrupted and finishes in
+    the background, so extraction itself should be bounded as well.
+    """
+
+    def __init__(self, mode: str = "process", workers: int = 2, timeout: float = 30.0):
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unknown PDF executor mode: {mode}")
+        self.mode = mode
+        self.workers = workers
+        self.timeout = timeout
+        self._executor: Optional[Executor] = None
+
+    def start(self) -> None:
+        """Create the worker pool."""
+        if self._executor is not None:
+            return
+        if self.mode == "process":
+            # Spawn rather than fork a process that already runs an event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="pdf"
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, dropping queued jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) in the pool, enforcing the per-document timeout."""
+        if self._executor is None:
+            self.start()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, func, *args)
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise ValueError(f"PDF parsing timed out after {self.timeout}s")
@@ -0,0 +1,186 @@
+"""Sampled stack profiling of individual requests."""
+
+import hmac
+import logging
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Optional
+
+from starlette.requests import Request
+
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_SUFFIX = ".collapsed"
+
+
+class StackSampler:
+    """Sample the Python stacks of all threads from a background thread.
+
+    Samples are counted per collapsed stack: the thread name followed by
+    the functions on the stack from the outermost, separated by ";". Code
+    running in the PDF worker processes is not visible; use the thread
+    executor to profile PDF parsing.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling and return the sample counts per collapsed stack."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.samples
+
+    def _frame_label(self, code) -> str:
+        """Name a function as qualname (file:first line)."""
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+            label = self._labels[code] = label.replace(';', ':')
+        return label
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._frame_label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(thread_names.get(ident, str(ident)).replace(';', ':'))
+                stack.reverse()
+                self.samples[';'.join(stack)] += 1
+
+
+class RequestProfiler:
+    """Profile sampled or explicitly requested requests.
+
+    A request is profiled when it sends admin_token in the X-Profile-Token
+    header, or otherwise with probability sample_rate. A profile samples
+    every thread of the process while the request runs, so it is a
+    process-wide window: requests handled concurrently on the event loop
+    or in worker threads appear in it too. Profiles are written, off the
+    event loop, to directory as collapsed-stack files, the input format of
+    flamegraph.pl and speedscope; the oldest files are removed to stay
+    within max_files and max_bytes. Only one request is profiled at a
+    time, and with profiling off a request costs a couple of attribute
+    checks.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 0.0,
+        admin_token: str = "",
+        interval: float = 0.005,
+        max_files: int = 100,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.admin_token = admin_token
+        self.interval = interval
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.enabled = sample_rate > 0 or bool(admin_token)
+        self._active = False
+        # Writes profiles and prunes the directory one at a time
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+
+    def capture(self, request: Request, label: str) -> ContextManager[Optional[str]]:
+        """Profile a block of request handling if the request is selected.
+
+        Yields the profile id, which is also the file name, or None when
+        the request is not profiled.
+        """
+        if not self.enabled or self._active or not self._selected(request):
+            return nullcontext()
+        return _ProfileCapture(self, label)
+
+    def _selected(self, request: Request) -> bool:
+        """Whether a request asked for profiling or was sampled."""
+        token = request.headers.get(PROFILE_HEADER)
+        if self.admin_token and token is not None and hmac.compare_digest(
+            token.encode(), self.admin_token.encode()
+        ):
+            return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _write(self, profile_id: str, samples: Counter) -> None:
+        """Write a profile and remove the oldest ones beyond the limits."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / profile_id).write_text(
+                ''.join(f"{stack} {count}\n" for stack, count in samples.items())
+            )
+            self._prune()
+        except OSError as e:
+            logger.warning(f"Could not write profile {profile_id}: {e}")
+
+    def _prune(self) -> None:
+        """Remove the oldest profiles beyond max_files or max_bytes."""
+        profiles = []
+        for path in self.directory.glob(f"*{PROFILE_SUFFIX}"):
+            stat = path.stat()
+            profiles.append((stat.st_mtime, stat.st_size, path))
+        profiles.sort(reverse=True)
+
+        total_bytes = 0
+        for count, (_, size, path) in enumerate(profiles, start=1):
+            total_bytes += size
+            if count > self.max_files or total_bytes > self.max_bytes:
+                path.unlink(missing_ok=True)
+
+
+class _ProfileCapture:
+    """Context manager sampling stacks for one profiled request."""
+
+    def __init__(self, profiler: RequestProfiler, label: str):
+        self.profiler = profiler
+        self.label = label
+        self.started = time.time()
+        self.profile_id = (
+            f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(self.started))}"
+            f"-{label}-{uuid.uuid4().hex[:8]}{PROFILE_SUFFIX}"
+        )
+        self.sampler = StackSampler(profiler.interval)
+
+    def __enter__(self) -> str:
+        self.profiler._active = True
+        self.sampler.start()
+        return self.profile_id
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            samples = self.sampler.stop()
+            self.profiler._writer.submit(self.profiler._write, self.profile_id, samples)
+            logger.info(
+                f"Profiled {self.label} in {time.time() - self.started:.3f}s "
+                f"({sum(samples.values())} samples): {self.profile_id}"
+            )
+        finally:
+            self.profiler._active = False
@@ -0,0 +1,105 @@
+"""In-memory cache of HTTP API responses."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+
+
+class CachedResponse:
+    """A cached response body with its validator and expiry."""
+
+    __slots__ = ('data', 'etag', 'headers', 'size', 'expires_at')
+
+    def __init__(
+        self,
+        data: Any,
+        etag: Optional[str],
+        headers: Mapping[str, str],
+        size: int,
+        expires_at: float
+    ):
+        self.data = data
+        self.etag = etag
+        self.headers = headers
+        self.size = size
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+    """LRU cache of API responses with a TTL and ETag revalidation.
+
+    Entries past their TTL are kept until evicted so their ETag can be
+    sent as If-None-Match; a 304 answer renews them without a new body.
+    The cache is bounded both by entry count and by total body bytes.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._total_bytes = 0
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'revalidations': 0,
+            'evictions': 0,
+        }
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get an entry, fresh or stale, and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        data: Any,
+        etag: Optional[str],
+        headers: Mapping[str, str],
+        size: int
+    ) -> None:
+        """Store a response body, evicting least recently used entries."""
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = CachedResponse(
+            data, etag, dict(headers), size, time.monotonic() + self.ttl
+        )
+        self._total_bytes += size
+
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats['evictions'] += 1
+
+    def renew(self, key: str) -> None:
+        """Restart the TTL of an entry after a successful revalidation."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache counters and current usage."""
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+        }
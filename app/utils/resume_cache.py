@@ -0,0 +1,182 @@
+"""Content-addressed cache of resume processing results."""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResumeCache:
+    """LRU cache of resume results keyed by a SHA-256 of their input.
+
+    Values must be JSON-serializable. The in-memory tier is bounded by
+    entry count and serialized size; the optional disk tier keeps one JSON
+    file per key and survives restarts. It is bounded by disk_max_entries
+    and disk_max_bytes, dropping the least recently used files by mtime.
+    Cached values are shared between callers and must not be modified.
+    """
+
+    # Disk pruning goes this far below the bounds, so it does not rescan
+    # the directory on every write
+    DISK_PRUNE_TARGET = 0.9
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        directory: str = "",
+        disk_max_entries: int = 10_000,
+        disk_max_bytes: int = 512 * 1024 * 1024
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        self.disk_max_entries = disk_max_entries
+        self.disk_max_bytes = disk_max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        # Disk tier usage as (files, bytes), counted on the first write
+        self._disk_usage: Optional[Tuple[int, int]] = None
+        self.stats = {
+            'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0,
+            'disk_evictions': 0, 'disk_errors': 0,
+        }
+
+    @staticmethod
+    def make_key(namespace: str, data: bytes, version: str = "") -> str:
+        """Build a cache key from a namespace, the input bytes and a version."""
+        digest = hashlib.sha256(data).hexdigest()
+        return f"{namespace}-{version}-{digest}" if version else f"{namespace}-{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value from memory or disk."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return entry[0]
+
+        if self.directory is not None:
+            path = self._disk_path(key)
+            try:
+                raw = path.read_bytes()
+                value = json.loads(raw)
+            except OSError:
+                pass
+            except ValueError:
+                # Truncated or corrupt entry; drop it and recompute
+                logger.warning(f"Dropping corrupt resume cache entry {path}")
+                self.stats['disk_errors'] += 1
+                path.unlink(missing_ok=True)
+            else:
+                self._store(key, value, len(raw))
+                self.stats['disk_hits'] += 1
+                try:
+                    os.utime(path)
+                except OSError:
+                    pass
+                return value
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a value in memory and, if configured, on disk."""
+        raw = json.dumps(value).encode('utf-8')
+        self._store(key, value, len(raw))
+
+        if self.directory is not None:
+            path = self._disk_path(key)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+                temp_path.write_bytes(raw)
+                temp_path.replace(path)
+                self._track_disk_write(len(raw))
+            except OSError as e:
+                logger.warning(f"Could not write resume cache entry: {e}")
+
+    def _track_disk_write(self, size: int) -> None:
+        """Count a disk tier write, pruning once the tier is over its bounds."""
+        if self._disk_usage is None:
+            self._disk_usage = self._prune_disk(self.disk_max_entries, self.disk_max_bytes)
+            return
+        files, total_bytes = self._disk_usage
+        self._disk_usage = (files + 1, total_bytes + size)
+        if self._disk_usage[0] > self.disk_max_entries or self._disk_usage[1] > self.disk_max_bytes:
+            self._disk_usage = self._prune_disk(
+                int(self.disk_max_entries * self.DISK_PRUNE_TARGET),
+                int(self.disk_max_bytes * self.DISK_PRUNE_TARGET),
+            )
+
+    def _prune_disk(self, max_files: int, max_bytes: int) -> Tuple[int, int]:
+        """Remove the least recently used files beyond the given bounds.
+
+        Returns the files and bytes left.
+        """
+        entries = []
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(reverse=True)
+
+        files = total_bytes = 0
+        for _, size, path in entries:
+            if files + 1 > max_files or total_bytes + size > max_bytes:
+                path.unlink(missing_ok=True)
+                self.stats['disk_evictions'] += 1
+            else:
+                files += 1
+                total_bytes += size
+        return files, total_bytes
+
+    def _store(self, key: str, value: Any, size: int) -> None:
+        """Insert a value into the memory tier, evicting old entries."""
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old[1]
+        self._entries[key] = (value, size)
+        self._total_bytes += size
+
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._total_bytes -= evicted_size
+            self.stats['evictions'] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        """Get the disk tier file for a key."""
+        return self.directory / key[-2:] / f"{key}.json"
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache counters and current memory usage."""
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_resume_cache() -> ResumeCache:
+    """Get the process-wide resume cache."""
+    return ResumeCache(
+        max_entries=settings.RESUME_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESUME_CACHE_MAX_BYTES,
+        directory=settings.RESUME_CACHE_DIR,
+        disk_max_entries=settings.RESUME_CACHE_DISK_MAX_ENTRIES,
+        disk_max_bytes=settings.RESUME_CACHE_DISK_MAX_BYTES,
+    )
@@ -0,0 +1,30 @@
+"""Resume section detection utilities."""
+
+import re
+from bisect import bisect_right
+from typing import List, Tuple
+
+
+# Checked in order; the first pattern found on a line names its section
+SECTION_PATTERNS = {
+    'skills': re.compile(r'(?i)(skills?|technical skills?|core competenc\w+|expertise)'),
+    'experience': re.compile(r'(?i)(experience|work experience|employment|professional experience)'),
+    'education': re.compile(r'(?i)(education|academic|qualification|degree)'),
+    'projects': re.compile(r'(?i)(projects?|portfolio|work samples)'),
+}
+
+
+def find_section_starts(text: str) -> List[Tuple[int, str]]:
+    """Find the offsets of lines that start a new resume section.
+
+    Returns (line_offset, section) pairs in text order. A line starts a
+    section when any section keyword appears in it.
+    """
+    line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+    headers = {}
+    for section, pattern in SECTION_PATTERNS.items():
+        for match in pattern.finditer(text):
+            line = bisect_right(line_starts, match.start()) - 1
+            headers.setdefault(line, section)
+    return [(line_starts[line], headers[line]) for line in sorted(headers)]
+
@@ -0,0 +1,58 @@
+"""Request coalescing for concurrent async calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one shared task.
+
+    The first caller for a key starts the work; callers arriving while it
+    runs wait on the same task and receive its result or exception. Each
+    caller waits through asyncio.shield, so a cancelled caller (for example
+    a disconnected client) stops waiting without cancelling the work the
+    other callers depend on. The work itself can check has_waiters at
+    safe points and stop early once every caller has gone; such calls are
+    counted as abandoned.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.stats = {'started': 0, 'coalesced': 0, 'abandoned': 0}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func for key, or join the call already in flight."""
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.stats['started'] += 1
+        else:
+            self.stats['coalesced'] += 1
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def has_waiters(self, key: Hashable) -> bool:
+        """Whether any caller is still waiting on the call for key."""
+        return key in self._waiters
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """Drop a finished task so the next call starts fresh."""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if task.cancelled():
+            self.stats['abandoned'] += 1
+        else:
+            # Mark the exception as retrieved in case every caller went away
+            task.exception()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing counters and the number of calls in flight."""
+        return {**self.stats, 'in_flight': len(self._tasks)}
@@ -1,7 +1,16 @@
 """Skill database and matching utilities."""
 
-from typing import List, Set
-import re
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Set
+
+from app.config import settings
+from app.utils.skill_taxonomy import SkillTaxonomy
+
+
+logger = logging.getLogger(__name__)
 
 
 class SkillDatabase:
@@ -53,44 +62,92 @@ class SkillDatabase:
         'swift', 'swiftui', 'kotlin', 'java', 'cordova', 'phonegap'
     }
     
+    ALIASES = {
+        'node.js': 'nodejs',
+        'node js': 'nodejs',
+        'react.js': 'react',
+        'vue.js': 'vue',
+        'angular.js': 'angular',
+        'aspnet': 'asp.net',
+        'asp net': 'asp.net',
+        'c sharp': 'c#',
+        'c plus plus': 'c++',
+        'cpp': 'c++',
+        'js': 'javascript',
+        'ts': 'typescript',
+        'py': 'python',
+        'ml': 'machine learning',
+        'ai': 'artificial intelligence'
+    }
+    
+    @classmethod
+    def get_categories(cls) -> Dict[str, Set[str]]:
+        """Get the built-in skills grouped by category."""
+        return {
+            'programming_languages': cls.PROGRAMMING_LANGUAGES,
+            'frameworks': cls.FRAMEWORKS,
+            'databases': cls.DATABASES,
+            'cloud_platforms': cls.CLOUD_PLATFORMS,
+            'devops_tools': cls.DEVOPS_TOOLS,
+            'data_science': cls.DATA_SCIENCE,
+            'mobile': cls.MOBILE,
+        }
+    
     @classmethod
     def get_all_skills(cls) -> Set[str]:
-        """Get all skills from the database."""
-        all_skills = set()
-        all_skills.update(cls.PROGRAMMING_LANGUAGES)
-        all_skills.update(cls.FRAMEWORKS)
-        all_skills.update(cls.DATABASES)
-        all_skills.update(cls.CLOUD_PLATFORMS)
-        all_skills.update(cls.DEVOPS_TOOLS)
-        all_skills.update(cls.DATA_SCIENCE)
-        all_skills.update(cls.MOBILE)
-        return all_skills
+        """Get all skills from the active taxonomy."""
+        return get_skill_taxonomy().skills
     
     @classmethod
     def normalize_skill(cls, skill: str) -> str:
         """Normalize skill name for matching."""
-        skill = skill.lower().strip()
-        # Remove special characters except for #, +, -, .
-        skill = re.sub(r'[^a-z0-9#+\-.\s]', '', skill)
-        # Replace common variations
-        replacements = {
-            'node.js': 'nodejs',
-            'node js': 'nodejs',
-            'react.js': 'react',
-            'vue.js': 'vue',
-            'angular.js': 'angular',
-            'aspnet': 'asp.net',
-            'asp net': 'asp.net',
-            'c sharp': 'c#',
-            'c plus plus': 'c++',
-            'cpp': 'c++',
-            'js': 'javascript',
-            'ts': 'typescript',
-            'py': 'python',
-            'ml': 'machine learning',
-            'ai': 'artificial intelligence'
-        }
-        for old, new in replacements.items():
-            if skill == old:
-                skill = new
-        return skill
+        return get_skill_taxonomy().normalize(skill)
+
+
+def load_skill_taxonomy(path: str = "", snapshot_path: str = "") -> SkillTaxonomy:
+    """Load a skill taxonomy from a file or the built-in database.
+    
+    When a snapshot path is given, a snapshot matching the source version is
+    loaded instead of rebuilding the index, and a fresh one is written after
+    a rebuild.
+    """
+    if path:
+        raw = Path(path).read_bytes()
+        version = hashlib.sha256(raw).hexdigest()
+    else:
+        raw = None
+        version = SkillTaxonomy.compute_digest(
+            SkillDatabase.get_categories(),
+            SkillDatabase.ALIASES
+        )
+    
+    if snapshot_path:
+        taxonomy = SkillTaxonomy.load_snapshot(snapshot_path, version)
+        if taxonomy is not None:
+            return taxonomy
+    
+    if raw is not None:
+        taxonomy = SkillTaxonomy.from_json(raw, version=version)
+    else:
+        taxonomy = SkillTaxonomy(
+            SkillDatabase.get_categories(),
+            SkillDatabase.ALIASES,
+            version=version
+        )
+    
+    if snapshot_path:
+        try:
+            taxonomy.save_snapshot(snapshot_path)
+        except OSError as e:
+            logger.warning(f"Could not write skill taxonomy snapshot: {e}")
+    
+    return taxonomy
+
+
+@lru_cache(maxsize=None)
+def get_skill_taxonomy() -> SkillTaxonomy:
+    """Get the process-wide skill taxonomy, building it on first use."""
+    return load_skill_taxonomy(
+        settings.SKILL_TAXONOMY_PATH,
+        settings.SKILL_TAXONOMY_SNAPSHOT
+    )
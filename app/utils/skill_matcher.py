@@ -0,0 +1,104 @@
+"""Single-pass multi-pattern matching of skill terms."""
+
+import re
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+
+_WORD_CHAR = re.compile(r'\w')
+_TERMINAL = ''
+
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a regex word character."""
+    return _WORD_CHAR.match(char) is not None
+
+
+def _build_trie(terms: Iterable[str]) -> Dict:
+    """Build a character trie from terms."""
+    root: Dict = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = {}
+    return root
+
+
+def _trie_to_pattern(node: Dict) -> str:
+    """Convert a trie into a regex that prefers the longest term."""
+    branches = [
+        re.escape(char) + _trie_to_pattern(child)
+        for char, child in sorted(node.items())
+        if char != _TERMINAL
+    ]
+    if not branches:
+        return ''
+    body = '|'.join(branches)
+    if _TERMINAL in node:
+        # Longer terms are tried first, the term ending here is the fallback
+        return f'(?:{body})?'
+    if len(branches) == 1:
+        return body
+    return f'(?:{body})'
+
+
+class SkillMatcher:
+    """Find every occurrence of a set of terms in one scan of the text.
+
+    The terms are compiled into a single trie-shaped regex wrapped in a
+    lookahead, so the engine visits each text position once and reports
+    the longest term starting there. Shorter terms that are prefixes of
+    that match are derived from a precomputed table instead of being
+    searched for again.
+    """
+
+    def __init__(self, terms: Iterable[str], word_boundaries: bool = True):
+        self.terms = frozenset(term for term in terms if term)
+        self.word_boundaries = word_boundaries
+        boundary = r'\b' if word_boundaries else ''
+        trie = _build_trie(sorted(self.terms))
+        self.pattern = re.compile(
+            f'{boundary}(?=({_trie_to_pattern(trie)}){boundary})'
+        ) if self.terms else None
+        self._implied = self._build_implied()
+
+    def _build_implied(self) -> Dict[str, Tuple[str, ...]]:
+        """Map each term to the shorter terms matched at the same position."""
+        implied: Dict[str, Tuple[str, ...]] = {}
+        for term in self.terms:
+            prefixes = []
+            for end in range(1, len(term)):
+                prefix = term[:end]
+                if prefix not in self.terms:
+                    continue
+                # The character after the prefix is known, so the end
+                # boundary of the prefix can be decided up front
+                if self.word_boundaries and (
+                    _is_word_char(prefix[-1]) == _is_word_char(term[end])
+                ):
+                    continue
+                prefixes.append(prefix)
+            implied[term] = tuple(prefixes)
+        return implied
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield (start, end, term) for every occurrence of every term."""
+        if self.pattern is None:
+            return
+        for match in self.pattern.finditer(text):
+            term = match.group(1)
+            start = match.start()
+            for prefix in self._implied[term]:
+                yield start, start + len(prefix), prefix
+            yield start, start + len(term), term
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of terms that occur in the text."""
+        found: Set[str] = set()
+        if self.pattern is None:
+            return found
+        implied = self._implied
+        for term in self.pattern.findall(text):
+            found.add(term)
+            found.update(implied[term])
+        return found
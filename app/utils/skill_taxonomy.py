@@ -0,0 +1,134 @@
+"""Immutable skill taxonomy index."""
+
+import hashlib
+import json
+import pickle
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+from app.utils.skill_matcher import SkillMatcher
+
+
+SNAPSHOT_FORMAT = 1
+
+
+class SkillTaxonomy:
+    """Frozen index of canonical skills, aliases, categories and matchers.
+
+    Built once per process; every lookup on the request path is a single
+    set or dict access.
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        aliases: Mapping[str, str],
+        version: Optional[str] = None
+    ):
+        self._set_index(
+            {
+                name: frozenset(skill.lower().strip() for skill in skills)
+                for name, skills in categories.items()
+            },
+            {
+                alias.lower().strip(): canonical.lower().strip()
+                for alias, canonical in aliases.items()
+            },
+            version,
+        )
+        self.matcher = SkillMatcher(self.skills)
+
+    def _set_index(
+        self,
+        categories: Dict[str, frozenset],
+        aliases: Dict[str, str],
+        version: Optional[str]
+    ) -> None:
+        """Populate the read-only lookup structures."""
+        skill_categories: Dict[str, Tuple[str, ...]] = {}
+        for name, skills in categories.items():
+            for skill in skills:
+                skill_categories[skill] = skill_categories.get(skill, ()) + (name,)
+
+        self.categories = MappingProxyType(categories)
+        self.aliases = MappingProxyType(aliases)
+        self.skill_categories = MappingProxyType(skill_categories)
+        self.skills = frozenset(skill_categories)
+        self.version = version or self.compute_digest(categories, aliases)
+
+    @staticmethod
+    def compute_digest(categories: Mapping[str, Iterable[str]], aliases: Mapping[str, str]) -> str:
+        """Compute a stable content digest for a taxonomy definition."""
+        payload = json.dumps(
+            {
+                'categories': {name: sorted(skills) for name, skills in categories.items()},
+                'aliases': dict(aliases),
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def from_json(cls, raw: bytes, version: Optional[str] = None) -> 'SkillTaxonomy':
+        """Build a taxonomy from a JSON document.
+
+        The document has the form
+        ``{"categories": {"name": ["skill", ...]}, "aliases": {"alias": "skill"}}``.
+        """
+        data = json.loads(raw)
+        if not isinstance(data.get('categories'), dict):
+            raise ValueError("Skill taxonomy file must define a 'categories' object")
+        return cls(data['categories'], data.get('aliases', {}), version=version)
+
+    def normalize(self, skill: str) -> str:
+        """Normalize a skill name and resolve aliases to the canonical name."""
+        skill = skill.lower().strip()
+        # Remove special characters except for #, +, -, .
+        skill = re.sub(r'[^a-z0-9#+\-.\s]', '', skill)
+        return self.aliases.get(skill, skill)
+
+    def get_category(self, skill: str) -> Optional[str]:
+        """Get the primary category of a canonical skill."""
+        categories = self.skill_categories.get(skill)
+        return categories[0] if categories else None
+
+    def save_snapshot(self, path: str) -> None:
+        """Serialize the taxonomy and its compiled matchers to a binary snapshot."""
+        snapshot_path = Path(path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = snapshot_path.with_suffix(snapshot_path.suffix + '.tmp')
+        with open(temp_path, 'wb') as f:
+            pickle.dump(
+                {'format': SNAPSHOT_FORMAT, 'version': self.version, 'taxonomy': self},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+        temp_path.replace(snapshot_path)
+
+    @classmethod
+    def load_snapshot(cls, path: str, version: Optional[str] = None) -> Optional['SkillTaxonomy']:
+        """Load a snapshot, returning None if it is missing or stale."""
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(data, dict) or data.get('format') != SNAPSHOT_FORMAT:
+            return None
+        if version is not None and data.get('version') != version:
+            return None
+        return data.get('taxonomy')
+
+    def __getstate__(self) -> Dict:
+        return {
+            'categories': dict(self.categories),
+            'aliases': dict(self.aliases),
+            'version': self.version,
+            'matcher': self.matcher,
+        }
+
+    def __setstate__(self, state: Dict) -> None:
+        self._set_index(state['categories'], state['aliases'], state['version'])
+        self.matcher = state['matcher']
@@ -0,0 +1,17 @@
+"""Microbenchmarks for the resume and GitHub analysis hot paths.
+
+Run from the repository root:
+
+    python -m benchmarks                          # run everything
+    python -m benchmarks -k 'skill_extractor.*'   # run matching benchmarks
+    python -m benchmarks --save baseline.json     # record a baseline
+    python -m benchmarks --compare baseline.json  # flag regressions over 20%
+
+Inputs are generated deterministically by benchmarks.corpus, so results
+are comparable across runs on the same machine. The exit status is 1 if
+a regression is found or the batch scoring check fails.
+
+For end-to-end load tests, benchmarks.fake_github serves a local stand-in
+for the GitHub API and benchmarks.loadgen drives the running app at a
+target request rate; see their module docstrings.
+"""
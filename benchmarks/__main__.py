@@ -0,0 +1,80 @@
+"""Command line entry point: python -m benchmarks --help."""
+
+import argparse
+import fnmatch
+import logging
+import sys
+
+from benchmarks.baseline import compare_results, load_baseline, save_baseline
+from benchmarks.suite import all_benchmarks, check_scoring_equivalence, run_benchmarks
+
+
+def _format_time(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time the resume and GitHub analysis hot paths.'
+    )
+    parser.add_argument('-k', '--filter', default='*', help='glob of benchmark names to run')
+    parser.add_argument('--list', action='store_true', help='list benchmark names and exit')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum seconds per run')
+    parser.add_argument('--save', metavar='PATH', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a JSON baseline')
+    parser.add_argument(
+        '--threshold', type=float, default=0.2,
+        help='slowdown that counts as a regression when comparing (0.2 = 20%%)'
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    benchmarks = [b for b in all_benchmarks() if fnmatch.fnmatch(b.name, args.filter)]
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    failures = check_scoring_equivalence()
+    for failure in failures:
+        print(f"CHECK FAILED {failure}")
+    if not failures:
+        print("check scoring_engine batch == scalar: ok")
+
+    width = max((len(b.name) for b in benchmarks), default=0)
+    results = run_benchmarks(
+        benchmarks,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        report=lambda name, result: print(
+            f"{name:<{width}}  {_format_time(result['median']):>12}  "
+            f"(min {_format_time(result['min'])}, {result['loops']} loops)"
+        ),
+    )
+
+    if args.save:
+        save_baseline(args.save, results)
+        print(f"saved baseline to {args.save}")
+
+    regressions = []
+    if args.compare:
+        rows, regressions = compare_results(load_baseline(args.compare), results, args.threshold)
+        print(f"\ncompared with {args.compare} (threshold {args.threshold:.0%})")
+        for name, before, after, ratio in rows:
+            flag = 'REGRESSION' if name in regressions else ''
+            print(
+                f"{name:<{width}}  {_format_time(before):>12} -> {_format_time(after):>12}  "
+                f"{ratio:6.2f}x  {flag}"
+            )
+
+    return 1 if failures or regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
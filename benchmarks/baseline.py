@@ -0,0 +1,57 @@
+"""JSON benchmark baselines and regression comparison."""
+
+import json
+import platform
+import sys
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+BASELINE_VERSION = 1
+
+
+def save_baseline(path: str, results: Dict[str, Dict]) -> None:
+    """Write benchmark results with the environment they were taken in."""
+    data = {
+        'version': BASELINE_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    """Read the results of a baseline file."""
+    with open(path) as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}: {data.get('version')}")
+    return data['results']
+
+
+def compare_results(
+    baseline: Dict[str, Dict],
+    results: Dict[str, Dict],
+    threshold: float = 0.2
+) -> Tuple[List[Tuple[str, float, float, float]], List[str]]:
+    """Compare median times against a baseline.
+
+    Returns (name, baseline seconds, current seconds, ratio) rows for the
+    benchmarks in both, and the names of those slower than the baseline
+    by more than threshold (0.2 = 20%).
+    """
+    rows = []
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['median']
+        after = result['median']
+        ratio = after / before if before > 0 else float('inf')
+        rows.append((name, before, after, ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return rows, regressions
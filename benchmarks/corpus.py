@@ -0,0 +1,147 @@
+"""Deterministic synthetic resumes and GitHub profiles."""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+# Fixed vocabularies, so corpora do not change when the skill taxonomy does
+SKILLS = [
+    'python', 'java', 'javascript', 'typescript', 'go', 'rust', 'c++', 'c#',
+    'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring', 'node.js',
+    'docker', 'kubernetes', 'terraform', 'ansible', 'aws', 'azure', 'gcp',
+    'postgresql', 'mysql', 'mongodb', 'redis', 'kafka', 'elasticsearch', 'graphql',
+    'machine learning', 'tensorflow', 'pytorch', 'pandas', 'numpy', 'git',
+    'jenkins', 'linux', 'html', 'css',
+]
+LANGUAGES = ['Python', 'JavaScript', 'TypeScript', 'Go', 'Java', 'Rust', 'C++', 'Shell', 'HTML', 'CSS']
+TOPICS = [
+    'api', 'cli', 'machine-learning', 'docker', 'kubernetes', 'react', 'django',
+    'data-science', 'devops', 'web', 'microservices', 'aws', 'pandas', 'terraform',
+]
+WORDS = (
+    'built designed led migrated scaled improved delivered maintained service '
+    'platform pipeline team customers latency throughput reliability features '
+    'deployment monitoring dashboard backend frontend integration tests release '
+    'architecture performance users data internal tooling automation'
+).split()
+HEADINGS = ['Skills', 'Experience', 'Projects', 'Education']
+
+# Resume sizes as paragraphs per section
+RESUME_SIZES = {'small': 2, 'medium': 8, 'large': 40}
+LINES_PER_PAGE = 55
+# Fixed reference date for timestamps, so stats do not drift over time
+REFERENCE_DATE = datetime(2024, 1, 1)
+
+
+def _sentence(rng: random.Random) -> str:
+    """Build a sentence of filler words with a skill or two mixed in."""
+    words = rng.sample(WORDS, 8) + rng.sample(SKILLS, rng.randint(1, 2))
+    rng.shuffle(words)
+    return ' '.join(words).capitalize() + '.'
+
+
+def make_resume_text(size: str = 'medium', seed: int = 0) -> str:
+    """Generate a resume with a heading and paragraphs per section."""
+    rng = random.Random(f"resume-{size}-{seed}")
+    paragraphs = RESUME_SIZES[size]
+    lines = ['Jane Candidate', 'jane@example.com']
+    for heading in HEADINGS:
+        lines.append(heading)
+        if heading == 'Skills':
+            lines.append(', '.join(rng.sample(SKILLS, 12)))
+        for _ in range(paragraphs):
+            lines.extend(_sentence(rng) for _ in range(3))
+    return '\n'.join(lines)
+
+
+def make_pdf(text: str, lines_per_page: int = LINES_PER_PAGE) -> bytes:
+    """Render text as a PDF with one line of Helvetica per text line."""
+    lines = text.split('\n')
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    font_id = 3 + 2 * len(pages)
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        (
+            f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(len(pages)))}] "
+            f"/Count {len(pages)} >>"
+        ).encode(),
+    ]
+    for index, page_lines in enumerate(pages):
+        operators = ['BT', '/F1 10 Tf', '12 TL', '50 760 Td']
+        for line in page_lines:
+            escaped = line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            operators.append(f"({escaped}) Tj T*")
+        operators.append('ET')
+        stream = '\n'.join(operators).encode('latin-1', 'replace')
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * index} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b"%010d 00000 n \n" % offset
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def make_resume_pdf(pages: int, seed: int = 0) -> bytes:
+    """Generate a resume PDF of about the given number of pages."""
+    text = make_resume_text('large', seed)
+    lines = text.split('\n')
+    while len(lines) < pages * LINES_PER_PAGE:
+        lines += lines
+    return make_pdf('\n'.join(lines[:pages * LINES_PER_PAGE]))
+
+
+def make_user(login: str = 'octocat', repo_count: int = 0) -> Dict:
+    """Generate a GitHub user profile."""
+    return {
+        'login': login,
+        'name': login.title(),
+        'public_repos': repo_count,
+        'followers': 42,
+        'following': 7,
+        'created_at': '2016-05-01T12:00:00Z',
+    }
+
+
+def make_repos(count: int, seed: int = 0, login: str = 'octocat') -> List[Dict]:
+    """Generate repository records like those of /users/{user}/repos."""
+    rng = random.Random(f"repos-{count}-{seed}")
+    repos = []
+    for index in range(count):
+        updated = REFERENCE_DATE - timedelta(days=rng.randint(0, 1500))
+        skills = rng.sample(SKILLS, 2)
+        repos.append({
+            'name': f"{skills[0].replace(' ', '-')}-{rng.choice(WORDS)}-{index}",
+            'owner': {'login': login},
+            'description': f"A {rng.choice(WORDS)} {skills[1]} {rng.choice(WORDS)} for {rng.choice(WORDS)}"
+                           if rng.random() < 0.8 else None,
+            'language': rng.choice(LANGUAGES),
+            'topics': rng.sample(TOPICS, rng.randint(0, 4)),
+            'stargazers_count': int(rng.paretovariate(1.2)) - 1,
+            'forks_count': rng.randint(0, 20),
+            'updated_at': updated.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'pushed_at': updated.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        })
+    return repos
+
+
+def make_languages(repos: List[Dict], seed: int = 0) -> Dict[str, int]:
+    """Generate combined language bytes for a list of repositories."""
+    rng = random.Random(f"languages-{len(repos)}-{seed}")
+    languages: Dict[str, int] = {}
+    for repo in repos:
+        for language in {repo['language'], rng.choice(LANGUAGES)}:
+            languages[language] = languages.get(language, 0) + rng.randint(1_000, 500_000)
+    return languages
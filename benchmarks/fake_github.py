@@ -0,0 +1,263 @@
+"""Local stand-in for the GitHub REST endpoints used by GitHubVerifier.
+
+Serves /users/{user}, /users/{user}/repos and /repos/{owner}/{repo}/languages
+with deterministic synthetic data, configurable latency, rate-limit
+headers, injected 403 and 5xx errors and ETag revalidation. Start it and
+point the app at it:
+
+    python -m benchmarks.fake_github --port 8765 --latency lognormal:40:0.5
+    GITHUB_API_URL=http://127.0.0.1:8765 uvicorn app.main:app
+
+Users whose login starts with "missing-" do not exist. Each other user
+has a stable number of repositories between --min-repos and --max-repos.
+Request counts by endpoint and status are served at /_fake/stats.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+from benchmarks import corpus
+
+MISSING_PREFIX = "missing-"
+SECONDARY_LIMIT_MESSAGE = "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution into a sampler returning seconds.
+
+    Specs are in milliseconds: none, fixed:MS, uniform:LOW:HIGH or
+    lognormal:MEDIAN:SIGMA.
+    """
+    kind, *params = spec.split(':')
+    try:
+        values = [float(param) for param in params]
+    except ValueError:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    if kind == 'none' and not values:
+        return lambda rng: 0.0
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'lognormal' and len(values) == 2:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+
+class FakeGitHub:
+    """Synthetic GitHub API with configurable latency, quota and failures.
+
+    Quota is kept per Authorization header (or per client address without
+    one) in fixed windows of rate_window seconds. As on GitHub, a 304
+    answer to If-None-Match does not count against it. error_403_rate of
+    requests get a secondary rate limit 403 with Retry-After, and
+    error_5xx_rate get a 500, 502 or 503.
+    """
+
+    def __init__(
+        self,
+        latency: str = 'none',
+        rate_limit: int = 5000,
+        rate_window: float = 3600.0,
+        error_403_rate: float = 0.0,
+        error_5xx_rate: float = 0.0,
+        retry_after: int = 1,
+        min_repos: int = 0,
+        max_repos: int = 100,
+        seed: int = 0
+    ):
+        self.latency = parse_latency(latency)
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_403_rate = error_403_rate
+        self.error_5xx_rate = error_5xx_rate
+        self.retry_after = retry_after
+        self.min_repos = min_repos
+        self.max_repos = max_repos
+        self.rng = random.Random(seed)
+        # Quota key -> (window reset time, requests used)
+        self._quota: Dict[str, Tuple[float, int]] = {}
+        self._repos: Dict[str, List[Dict]] = {}
+        self.stats: Counter = Counter()
+
+    def make_app(self) -> web.Application:
+        """Build the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get('/users/{user}', self._user)
+        app.router.add_get('/users/{user}/repos', self._repos_page)
+        app.router.add_get('/repos/{owner}/{repo}/languages', self._languages)
+        app.router.add_get('/_fake/stats', self._stats)
+        return app
+
+    def repos_for(self, login: str) -> List[Dict]:
+        """Get a user's repositories, most recently updated first."""
+        repos = self._repos.get(login)
+        if repos is None:
+            seed = zlib.crc32(login.encode())
+            count = self.min_repos + seed % (self.max_repos - self.min_repos + 1)
+            repos = sorted(
+                corpus.make_repos(count, seed=seed, login=login),
+                key=lambda repo: repo['updated_at'],
+                reverse=True,
+            )
+            self._repos[login] = repos
+        return repos
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith('/_fake/'):
+            return await handler(request)
+        endpoint = self._endpoint(request)
+
+        delay = self.latency(self.rng)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        key = request.headers.get('Authorization') or request.remote or 'anonymous'
+        now = time.time()
+        reset_at, used = self._quota.get(key, (0.0, 0))
+        if now >= reset_at:
+            reset_at, used = now + self.rate_window, 0
+
+        roll = self.rng.random()
+        if used >= self.rate_limit:
+            response = self._error(403, "API rate limit exceeded")
+        elif roll < self.error_403_rate:
+            response = self._error(403, SECONDARY_LIMIT_MESSAGE)
+            response.headers['Retry-After'] = str(self.retry_after)
+        elif roll < self.error_403_rate + self.error_5xx_rate:
+            status = self.rng.choice((500, 502, 503))
+            response = self._error(status, "Server Error")
+        else:
+            response = await handler(request)
+            if response.status != 304:
+                used += 1
+
+        self._quota[key] = (reset_at, used)
+        response.headers.update({
+            'X-RateLimit-Limit': str(self.rate_limit),
+            'X-RateLimit-Remaining': str(max(self.rate_limit - used, 0)),
+            'X-RateLimit-Reset': str(int(reset_at)),
+            'X-RateLimit-Used': str(used),
+            'X-RateLimit-Resource': 'core',
+        })
+        self.stats[f"{endpoint} {response.status}"] += 1
+        return response
+
+    @staticmethod
+    def _endpoint(request: web.Request) -> str:
+        """Name the endpoint of a request for the stats."""
+        if request.path.endswith('/languages'):
+            return 'languages'
+        if request.path.endswith('/repos'):
+            return 'repos'
+        return 'user'
+
+    @staticmethod
+    def _error(status: int, message: str) -> web.Response:
+        return web.json_response(
+            {'message': message, 'documentation_url': 'https://docs.github.com/rest'},
+            status=status
+        )
+
+    @staticmethod
+    def _json(request: web.Request, data, headers: Optional[Dict[str, str]] = None) -> web.Response:
+        """Answer with JSON and an ETag, or 304 if the client has it."""
+        body = json.dumps(data).encode()
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        headers = {**(headers or {}), 'ETag': etag}
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type='application/json', headers=headers)
+
+    async def _user(self, request: web.Request) -> web.Response:
+        login = request.match_info['user']
+        if login.startswith(MISSING_PREFIX):
+            return self._error(404, "Not Found")
+        return self._json(request, corpus.make_user(login, len(self.repos_for(login))))
+
+    async def _repos_page(self, request: web.Request) -> web.Response:
+        login = request.match_info['user']
+        if login.startswith(MISSING_PREFIX):
+            return self._error(404, "Not Found")
+        try:
+            per_page = min(max(int(request.query.get('per_page', 30)), 1), 100)
+            page = max(int(request.query.get('page', 1)), 1)
+        except ValueError:
+            return self._error(422, "Invalid pagination")
+
+        repos = self.repos_for(login)
+        last_page = max((len(repos) + per_page - 1) // per_page, 1)
+        links = []
+        if page < last_page:
+            for rel, target in (('next', page + 1), ('last', last_page)):
+                query = urlencode({**request.query, 'page': target})
+                links.append(f'<{request.scheme}://{request.host}{request.path}?{query}>; rel="{rel}"')
+        headers = {'Link': ', '.join(links)} if links else None
+        return self._json(request, repos[(page - 1) * per_page:page * per_page], headers)
+
+    async def _languages(self, request: web.Request) -> web.Response:
+        owner = request.match_info['owner']
+        if owner.startswith(MISSING_PREFIX):
+            return self._error(404, "Not Found")
+        rng = random.Random(f"{owner}/{request.match_info['repo']}")
+        languages = {
+            language: rng.randint(1_000, 500_000)
+            for language in rng.sample(corpus.LANGUAGES, rng.randint(1, 3))
+        }
+        return self._json(request, languages)
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response(dict(self.stats))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.fake_github',
+        description='Serve a local stand-in for the GitHub REST API.'
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument(
+        '--latency', default='none',
+        help='none, fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA (milliseconds)'
+    )
+    parser.add_argument('--rate-limit', type=int, default=5000, help='requests per window and token')
+    parser.add_argument('--rate-window', type=float, default=3600.0, help='quota window in seconds')
+    parser.add_argument('--error-403-rate', type=float, default=0.0, help='fraction of secondary rate limit 403s')
+    parser.add_argument('--error-5xx-rate', type=float, default=0.0, help='fraction of 500/502/503 responses')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds on injected 403s')
+    parser.add_argument('--min-repos', type=int, default=0)
+    parser.add_argument('--max-repos', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    fake = FakeGitHub(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        error_403_rate=args.error_403_rate,
+        error_5xx_rate=args.error_5xx_rate,
+        retry_after=args.retry_after,
+        min_repos=args.min_repos,
+        max_repos=args.max_repos,
+        seed=args.seed,
+    )
+    web.run_app(fake.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,236 @@
+"""Open-loop load generator for the running API.
+
+Sends a mix of /verify uploads, /extract-skills uploads and GitHub profile
+lookups at a target rate and reports throughput and latency percentiles
+per endpoint. Run the app against benchmarks.fake_github to load-test
+without GitHub quota:
+
+    python -m benchmarks.loadgen --url http://127.0.0.1:8000 --rps 20 --duration 30
+
+Requests are started on a fixed schedule whether or not earlier ones have
+finished, and latency is measured from the scheduled start, so a slow
+server shows up as latency rather than as a lower request rate. Requests
+that would exceed --max-in-flight are counted as dropped.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from benchmarks import corpus
+from benchmarks.fake_github import MISSING_PREFIX
+
+API_PREFIX = "/api/v1"
+ENDPOINTS = ('verify', 'extract-skills', 'github-profile')
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Get a nearest-rank percentile of sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse endpoint weights like verify=8,extract-skills=1."""
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class LoadGenerator:
+    """Send requests at a fixed rate and record their outcomes per endpoint."""
+
+    def __init__(
+        self,
+        url: str,
+        rps: float,
+        duration: float,
+        mix: Dict[str, float],
+        users: int = 50,
+        missing_rate: float = 0.0,
+        resumes: int = 10,
+        resume_pages: int = 1,
+        max_in_flight: int = 256,
+        timeout: float = 60.0,
+        seed: int = 0
+    ):
+        self.url = url.rstrip('/')
+        self.rps = rps
+        self.duration = duration
+        self.mix = mix
+        self.users = users
+        self.missing_rate = missing_rate
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.pdfs = [corpus.make_resume_pdf(resume_pages, seed=index) for index in range(resumes)]
+        self.latencies: Dict[str, List[float]] = {name: [] for name in mix}
+        self.statuses: Dict[str, Dict[str, int]] = {name: {} for name in mix}
+        self.dropped = 0
+        self._in_flight = 0
+
+    def _username(self) -> str:
+        if self.rng.random() < self.missing_rate:
+            return f"{MISSING_PREFIX}{self.rng.randrange(self.users)}"
+        return f"user-{self.rng.randrange(self.users)}"
+
+    def _upload(self, with_username: bool) -> aiohttp.FormData:
+        form = aiohttp.FormData()
+        form.add_field(
+            'resume',
+            self.rng.choice(self.pdfs),
+            filename='resume.pdf',
+            content_type='application/pdf'
+        )
+        if with_username:
+            form.add_field('github_username', self._username())
+        return form
+
+    async def _send(self, session: aiohttp.ClientSession, endpoint: str, scheduled: float) -> None:
+        try:
+            if endpoint == 'verify':
+                request = session.post(f"{self.url}{API_PREFIX}/verify", data=self._upload(True))
+            elif endpoint == 'extract-skills':
+                request = session.post(f"{self.url}{API_PREFIX}/extract-skills", data=self._upload(False))
+            else:
+                request = session.get(f"{self.url}{API_PREFIX}/github-profile/{self._username()}")
+            async with request as response:
+                await response.read()
+                outcome = str(response.status)
+        except asyncio.TimeoutError:
+            outcome = 'timeout'
+        except aiohttp.ClientError as e:
+            outcome = type(e).__name__
+        finally:
+            self._in_flight -= 1
+
+        self.latencies[endpoint].append(time.perf_counter() - scheduled)
+        statuses = self.statuses[endpoint]
+        statuses[outcome] = statuses.get(outcome, 0) + 1
+
+    async def run(self) -> Dict:
+        """Run the load and return the report."""
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        total = int(self.rps * self.duration)
+        tasks = []
+
+        connector = aiohttp.TCPConnector(limit=self.max_in_flight)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            started = time.perf_counter()
+            for index in range(total):
+                scheduled = started + index / self.rps
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if self._in_flight >= self.max_in_flight:
+                    self.dropped += 1
+                    continue
+                self._in_flight += 1
+                endpoint = self.rng.choices(names, weights)[0]
+                tasks.append(asyncio.ensure_future(self._send(session, endpoint, scheduled)))
+            await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - started
+
+        return self.report(elapsed)
+
+    def report(self, elapsed: float) -> Dict:
+        """Summarize throughput and latency per endpoint."""
+        endpoints = {}
+        for name, latencies in self.latencies.items():
+            latencies = sorted(latencies)
+            ok = sum(count for status, count in self.statuses[name].items() if status.startswith('2'))
+            endpoints[name] = {
+                'requests': len(latencies),
+                'ok': ok,
+                'statuses': self.statuses[name],
+                'throughput': ok / elapsed if elapsed > 0 else 0.0,
+                'p50': percentile(latencies, 0.50),
+                'p95': percentile(latencies, 0.95),
+                'p99': percentile(latencies, 0.99),
+                'max': latencies[-1] if latencies else None,
+            }
+        return {
+            'target_rps': self.rps,
+            'duration': elapsed,
+            'sent': sum(len(latencies) for latencies in self.latencies.values()),
+            'dropped': self.dropped,
+            'endpoints': endpoints,
+        }
+
+
+def _format_ms(seconds: Optional[float]) -> str:
+    return '-' if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.loadgen',
+        description='Load-test the running API at a target request rate.'
+    )
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help='base URL of the app')
+    parser.add_argument('--rps', type=float, default=10.0, help='requests started per second')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds to send requests for')
+    parser.add_argument(
+        '--mix', default='verify=1',
+        help=f"endpoint weights, e.g. verify=8,extract-skills=1 ({', '.join(ENDPOINTS)})"
+    )
+    parser.add_argument('--users', type=int, default=50, help='distinct GitHub usernames to use')
+    parser.add_argument('--missing-rate', type=float, default=0.0, help='fraction of nonexistent users')
+    parser.add_argument('--resumes', type=int, default=10, help='distinct resume PDFs to upload')
+    parser.add_argument('--resume-pages', type=int, default=1, help='pages per resume PDF')
+    parser.add_argument('--max-in-flight', type=int, default=256)
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds per request')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', metavar='PATH', help='also write the report as JSON')
+    args = parser.parse_args(argv)
+
+    generator = LoadGenerator(
+        args.url,
+        rps=args.rps,
+        duration=args.duration,
+        mix=parse_mix(args.mix),
+        users=args.users,
+        missing_rate=args.missing_rate,
+        resumes=args.resumes,
+        resume_pages=args.resume_pages,
+        max_in_flight=args.max_in_flight,
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+    report = asyncio.run(generator.run())
+
+    print(
+        f"sent {report['sent']} requests in {report['duration']:.1f}s "
+        f"(target {report['target_rps']:g} rps, {report['dropped']} dropped)"
+    )
+    print(f"{'endpoint':<16} {'requests':>8} {'ok/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  statuses")
+    for name, result in report['endpoints'].items():
+        statuses = ' '.join(f"{status}:{count}" for status, count in sorted(result['statuses'].items()))
+        print(
+            f"{name:<16} {result['requests']:>8} {result['throughput']:>8.2f} "
+            f"{_format_ms(result['p50']):>9} {_format_ms(result['p95']):>9} "
+            f"{_format_ms(result['p99']):>9} {_format_ms(result['max']):>9}  {statuses}"
+        )
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+"""Benchmark definitions, timing and correctness checks."""
+
+import random
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.github_verifier import GitHubVerifier
+from app.services.resume_parser import ResumeParser
+from app.services.scoring_engine import ScoringConfig, ScoringEngine
+from app.services.skill_extractor import SkillExtractor
+from app.utils.file_handler import FileHandler
+from app.utils.resume_cache import ResumeCache
+from benchmarks import corpus
+
+
+class Benchmark:
+    """A named function to time; setup builds its input outside the timing."""
+
+    def __init__(self, name: str, setup: Callable[[], Callable[[], object]]):
+        self.name = name
+        self.setup = setup
+
+
+def time_function(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict:
+    """Time a function, calibrating loops so each run takes at least min_time.
+
+    Returns seconds per call for the fastest and the median run.
+    """
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    runs = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        runs.append((time.perf_counter() - started) / loops)
+    return {
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'loops': loops,
+        'repeat': repeat,
+    }
+
+
+def _uncached_skill_extractor() -> SkillExtractor:
+    """Build a SkillExtractor that does not reuse results across calls."""
+    extractor = SkillExtractor()
+    extractor.cache = ResumeCache(max_entries=0, max_bytes=0)
+    return extractor
+
+
+def _skill_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for size in corpus.RESUME_SIZES:
+        def extract(size=size):
+            extractor = _uncached_skill_extractor()
+            text = corpus.make_resume_text(size)
+            return lambda: extractor.extract_skills(text)
+
+        def rank(size=size):
+            extractor = _uncached_skill_extractor()
+            text = corpus.make_resume_text(size)
+            occurrences = extractor.extract_skill_occurrences(text)
+            skills = list(occurrences)
+            return lambda: extractor.rank_skills(skills, text, occurrences)
+
+        def sections(size=size):
+            parser = ResumeParser()
+            text = corpus.make_resume_text(size)
+            return lambda: parser.extract_sections(text)
+
+        benchmarks += [
+            Benchmark(f"skill_extractor.extract_skills[{size}]", extract),
+            Benchmark(f"skill_extractor.rank_skills[{size}]", rank),
+            Benchmark(f"resume_parser.extract_sections[{size}]", sections),
+        ]
+    return benchmarks
+
+
+def _pdf_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for pages in (1, 5, 20):
+        def extract(pages=pages):
+            pdf = corpus.make_resume_pdf(pages)
+            return lambda: FileHandler.extract_text_from_pdf(pdf)
+
+        benchmarks.append(Benchmark(f"file_handler.extract_text_from_pdf[{pages}p]", extract))
+    return benchmarks
+
+
+def _github_benchmarks() -> List[Benchmark]:
+    benchmarks = []
+    for count in (1, 30, 100, 300):
+        def analyze(count=count):
+            verifier = GitHubVerifier()
+            repos = corpus.make_repos(count)
+            languages = corpus.make_languages(repos)
+            return lambda: verifier._analyze_skills(repos, languages)
+
+        def stats(count=count):
+            verifier = GitHubVerifier()
+            repos = corpus.make_repos(count)
+            languages = corpus.make_languages(repos)
+            user = corpus.make_user(repo_count=count)
+            return lambda: verifier._calculate_stats(user, repos, languages)
+
+        benchmarks += [
+            Benchmark(f"github_verifier._analyze_skills[{count}r]", analyze),
+            Benchmark(f"github_verifier._calculate_stats[{count}r]", stats),
+        ]
+    return benchmarks
+
+
+def _candidate_rows(count: int, seed: int = 0) -> List[Tuple[float, Dict, int, int]]:
+    """Generate (match percentage, github stats, resume and GitHub skill counts) rows.
+
+    Values concentrate on the thresholds of the default ScoringConfig.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        stats = {
+            'total_repos': rng.choice([0, 1, 3, 49, 50, 51, 300]),
+            'recent_activity': rng.randint(0, 15),
+            'total_stars': rng.choice([0, 5, 99, 100, 101, 12345]),
+            'has_popular_repos': rng.random() < 0.3,
+            'account_age_years': rng.choice([0, 1, 1.5, 2, 5, 7]),
+            'language_diversity': rng.randint(0, 8),
+        }
+        if rng.random() < 0.1:
+            del stats['recent_activity']
+        match_percentage = rng.choice([0.0, 100 / 3, 30.0, 40.0, 50.0, 70.0, rng.uniform(0, 100)])
+        rows.append((match_percentage, stats, rng.randint(0, 30), rng.randint(0, 30)))
+    return rows
+
+
+def _columns(rows: List[Tuple[float, Dict, int, int]]) -> Tuple[List, Dict[str, List], List, List]:
+    """Turn candidate rows into the columns of ScoringEngine.calculate_trust_scores."""
+    keys = {key for _, stats, _, _ in rows for key in stats}
+    return (
+        [row[0] for row in rows],
+        {key: [stats.get(key, 0) for _, stats, _, _ in rows] for key in keys},
+        [row[2] for row in rows],
+        [row[3] for row in rows],
+    )
+
+
+def _scoring_benchmarks() -> List[Benchmark]:
+    def match(count):
+        def setup():
+            engine = ScoringEngine()
+            resume_skills = corpus.SKILLS[:count]
+            github_skills = [skill.title() for skill in corpus.SKILLS[count // 2:]] + ['react native']
+            return lambda: engine.calculate_match_score(resume_skills, github_skills)
+        return setup
+
+    def scalar(count):
+        def setup():
+            engine = ScoringEngine()
+            rows = _candidate_rows(count)
+
+            def run():
+                for match_percentage, stats, resume_count, github_count in rows:
+                    score = engine.calculate_trust_score(match_percentage, stats, resume_count, github_count)
+                    engine.determine_risk_level(score, match_percentage)
+            return run
+        return setup
+
+    def vector(count):
+        def setup():
+            engine = ScoringEngine()
+            match_percentages, stats, resume_counts, github_counts = _columns(_candidate_rows(count))
+
+            def run():
+                scores = engine.calculate_trust_scores(match_percentages, stats, resume_counts, github_counts)
+                engine.determine_risk_levels(scores, match_percentages)
+            return run
+        return setup
+
+    return [
+        Benchmark("scoring_engine.calculate_match_score[10s]", match(10)),
+        Benchmark("scoring_engine.calculate_match_score[40s]", match(40)),
+        Benchmark("scoring_engine.scalar_scores[10000c]", scalar(10_000)),
+        Benchmark("scoring_engine.vector_scores[10000c]", vector(10_000)),
+    ]
+
+
+def all_benchmarks() -> List[Benchmark]:
+    """Get every benchmark in the suite."""
+    return _skill_benchmarks() + _pdf_benchmarks() + _github_benchmarks() + _scoring_benchmarks()
+
+
+def check_scoring_equivalence(count: int = 20_000, seed: int = 0) -> List[str]:
+    """Check that batch scoring matches the scalar path bit for bit.
+
+    Runs under the default ScoringConfig and a custom one, and returns a
+    description of each mismatch.
+    """
+    configs = {
+        'default': ScoringConfig(),
+        'custom': ScoringConfig(
+            match_weight=0.37,
+            repos_scale=13,
+            skill_depth_tiers=((0.9, 20), (0.2, 3)),
+            high_risk=(10, 55),
+        ),
+    }
+    failures = []
+    for config_name, config in configs.items():
+        engine = ScoringEngine(config)
+        rows = _candidate_rows(count, seed)
+        expected_scores = [engine.calculate_trust_score(*row) for row in rows]
+        expected_risks = [
+            engine.determine_risk_level(score, row[0])
+            for score, row in zip(expected_scores, rows)
+        ]
+
+        match_percentages, stats, resume_counts, github_counts = _columns(rows)
+        scores = engine.calculate_trust_scores(match_percentages, stats, resume_counts, github_counts)
+        risks = engine.determine_risk_levels(scores, match_percentages)
+
+        for index in np.flatnonzero(scores != np.array(expected_scores))[:5]:
+            failures.append(
+                f"{config_name}: trust score of row {index} is {scores[index]!r}, "
+                f"scalar path gives {expected_scores[index]!r}"
+            )
+        for index, (risk, expected) in enumerate(zip(risks, expected_risks)):
+            if risk != expected:
+                failures.append(f"{config_name}: risk level of row {index} is {risk}, scalar path gives {expected}")
+                break
+    return failures
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    report: Optional[Callable[[str, Dict], None]] = None
+) -> Dict[str, Dict]:
+    """Time benchmarks and return their results by name."""
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = time_function(benchmark.setup(), repeat=repeat, min_time=min_time)
+        if report is not None:
+            report(benchmark.name, results[benchmark.name])
+    return results
@@ -0,0 +1,67 @@
+"""Tests that batch scoring matches the per-candidate path."""
+
+import random
+
+import numpy as np
+import pytest
+
+from app.services.scoring_engine import ScoringConfig, ScoringEngine
+
+
+CONFIGS = {
+    'default': ScoringConfig(),
+    'custom': ScoringConfig(
+        match_weight=0.37,
+        repos_scale=13,
+        skill_depth_tiers=((0.9, 20), (0.2, 3)),
+        high_risk=(10, 55),
+    ),
+}
+
+
+def random_candidates(count, seed=0):
+    """Generate (match percentage, github stats, resume and GitHub skill counts) rows.
+
+    Values concentrate on the default thresholds, and some rows lack
+    recent_activity to exercise missing stats.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        stats = {
+            'total_repos': rng.choice([0, 1, 3, 49, 50, 51, 300]),
+            'recent_activity': rng.randint(0, 15),
+            'total_stars': rng.choice([0, 5, 99, 100, 101, 12345]),
+            'has_popular_repos': rng.random() < 0.3,
+            'account_age_years': rng.choice([0, 1, 1.5, 2, 5, 7]),
+            'language_diversity': rng.randint(0, 8),
+        }
+        if rng.random() < 0.1:
+            del stats['recent_activity']
+        match_percentage = rng.choice([0.0, 100 / 3, 30.0, 40.0, 50.0, 70.0, rng.uniform(0, 100)])
+        rows.append((match_percentage, stats, rng.randint(0, 30), rng.randint(0, 30)))
+    return rows
+
+
+@pytest.mark.parametrize('config_name', sorted(CONFIGS))
+def test_batch_scoring_matches_scalar(config_name):
+    engine = ScoringEngine(CONFIGS[config_name])
+    rows = random_candidates(5000)
+
+    expected_scores = [engine.calculate_trust_score(*row) for row in rows]
+    expected_risks = [
+        engine.determine_risk_level(score, row[0])
+        for score, row in zip(expected_scores, rows)
+    ]
+
+    keys = {key for _, stats, _, _ in rows for key in stats}
+    scores = engine.calculate_trust_scores(
+        [row[0] for row in rows],
+        {key: [stats.get(key, 0) for _, stats, _, _ in rows] for key in keys},
+        [row[2] for row in rows],
+        [row[3] for row in rows],
+    )
+    risks = engine.determine_risk_levels(scores, [row[0] for row in rows])
+
+    np.testing.assert_array_equal(scores, np.array(expected_scores))
+    assert list(risks) == expected_risks
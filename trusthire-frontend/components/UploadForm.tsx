@@ -3,28 +3,40 @@
 import { useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
+import { verifyResumeStream } from "@/services/api";
+
+const describeEvent = (event: string, data: any) => {
+  switch (event) {
+    case "resume_skills":
+      return `Found ${data.count} skills in resume`;
+    case "github_profile":
+      return `Fetched GitHub profile of ${data.username}`;
+    case "github_repos":
+      return `Fetched ${data.count} repositories`;
+    case "github_languages":
+      return `Resolved ${data.languages.length} languages`;
+    default:
+      return event;
+  }
+};
 
 export default function UploadForm({ setResult }: any) {
   const [file, setFile] = useState<File | null>(null);
   const [github, setGithub] = useState("");
+  const [progress, setProgress] = useState<string[]>([]);
 
   const handleSubmit = async () => {
     if (!file || !github) return;
 
-    const formData = new FormData();
-    formData.append("resume", file);
-    formData.append("github_username", github);
-
-    const res = await fetch(
-      "http://127.0.0.1:8000/api/v1/verify",
-      {
-        method: "POST",
-        body: formData,
-      }
-    );
-
-    const data = await res.json();
-    setResult(data);
+    setProgress([]);
+    try {
+      const data = await verifyResumeStream(file, github, ({ event, data }) =>
+        setProgress((steps) => [...steps, describeEvent(event, data)])
+      );
+      setResult(data);
+    } catch (e: any) {
+      setProgress((steps) => [...steps, e.message]);
+    }
   };
 
   return (
@@ -53,6 +65,14 @@ export default function UploadForm({ setResult }: any) {
       >
         Verify Resume
       </Button>
+
+      {progress.length > 0 && (
+        <ul className="mt-4 text-sm text-gray-600">
+          {progress.map((step, i) => (
+            <li key={i}>{step}</li>
+          ))}
+        </ul>
+      )}
     </div>
   );
 }
\ No newline at end of file
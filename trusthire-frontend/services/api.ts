@@ -13,4 +13,58 @@ export const verifyResume = async (file: File, github: string) => {
   }
 
   return res.json();
-};
\ No newline at end of file
+};
+
+export type VerifyEvent = { event: string; data: any };
+
+// Same as verifyResume, but calls onEvent with each progress event
+// (resume_skills, github_profile, github_repos, github_languages)
+// before resolving with the final result.
+export const verifyResumeStream = async (
+  file: File,
+  github: string,
+  onEvent: (event: VerifyEvent) => void
+) => {
+  const formData = new FormData();
+  formData.append("resume", file);
+  formData.append("github_username", github);
+
+  const res = await fetch("http://127.0.0.1:8000/api/v1/verify/stream", {
+    method: "POST",
+    body: formData,
+  });
+
+  if (!res.ok || !res.body) {
+    throw new Error("Verification failed");
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let end;
+    while ((end = buffer.indexOf("\n\n")) !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+
+      let event = "message";
+      let data = "";
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event: ")) event = line.slice(7);
+        else if (line.startsWith("data: ")) data += line.slice(6);
+      }
+      const parsed = data ? JSON.parse(data) : null;
+
+      if (event === "result") return parsed;
+      if (event === "error") throw new Error(parsed.error);
+      onEvent({ event, data: parsed });
+    }
+  }
+
+  throw new Error("Verification failed");
+};